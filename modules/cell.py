@@ -12,7 +12,7 @@ representing the probability of the cell being alive. Its evolution is driven by
 a combination of deterministic rules and probabilistic factors.
 """
 
-import itertools
+import functools
 import math
 from typing import Union
 
@@ -21,6 +21,150 @@ import numpy as np
 from life.modules.rule import Rule
 
 
+def poisson_binomial(probs: np.ndarray,
+                     max_count: int | None = None):
+    """
+    Calculate the probability distribution of the number of alive cells among
+    a group of cells, each being alive independently with its own probability.
+
+    This distribution is known as the Poisson binomial distribution. Instead of
+    iterating over all the combinations of alive cells, it is computed by the
+    recurrence that multiplies the polynomial of the distribution with the term
+    (1 - p) + p * x for each cell, where p is the probability that the cell is
+    alive.
+
+    Parameters
+    ----------
+    probs: np.ndarray
+        The probabilities that the cells are alive, along the first axis.
+        Any further axes are treated independently, so that the distributions
+        of many groups of cells can be computed at once.
+
+    max_count: int | None, default=None
+        The largest number of alive cells whose probability is needed. Since
+        the probability of n alive cells only depends on those of fewer alive
+        cells, the recurrence can stop there. If None, the probabilities of
+        all possible numbers of alive cells are computed.
+
+    Returns
+    -------
+    dist: np.ndarray
+        The probabilities of having exactly 0, 1, ..., k alive cells, where k
+        is the number of cells or `max_count`, whichever is smaller, along the
+        first axis.
+    """
+
+    probs = np.asarray(probs, dtype=float)
+
+    # Determine how many numbers of alive cells to keep track of
+    n_counts = len(probs) + 1
+    if max_count is not None:
+        n_counts = min(max_count + 1, n_counts)
+
+    # Start with a certainty of zero alive cells
+    dist = np.zeros((n_counts,) + probs.shape[1:])
+    dist[0] = 1
+
+    # Add the cells one at a time to the distribution
+    for p in probs:
+        dist[1:] = dist[1:] * (1 - p) + dist[:-1] * p
+        dist[0] *= 1 - p
+
+    return dist
+
+
+@functools.lru_cache(maxsize=100_000)
+def poisson_binomial_pmf(probs: tuple):
+    """
+    Calculate the Poisson binomial distribution of the number of alive cells
+    among a small group of cells, given their sorted probabilities of being
+    alive.
+
+    The distribution only depends on the probabilities and not on their order,
+    so the results are memoized by the sorted tuple of probabilities. Since the
+    states are rounded to two decimal places, many cells of a grid share the
+    same neighborhood, especially in sparse grids where most neighbors are
+    dead. When all the probabilities are equal, the distribution is binomial
+    and is computed in closed form.
+
+    Parameters
+    ----------
+    probs: tuple
+        The probabilities that the cells are alive, sorted in ascending order.
+
+    Returns
+    -------
+    dist: tuple
+        The probabilities of having exactly 0, 1, ..., k alive cells, where k
+        is the number of cells.
+    """
+
+    k = len(probs)
+
+    # If all the probabilities are equal, use the binomial distribution
+    if k and probs[0] == probs[-1]:
+        p = probs[0]
+        return tuple(math.comb(k, n) * p ** n * (1 - p) ** (k - n)
+                     for n in range(k + 1))
+
+    # Start with a certainty of zero alive cells
+    dist = [1.0] + [0.0] * k
+
+    # Add the cells one at a time to the distribution
+    for i, p in enumerate(probs, start=1):
+        q = 1 - p
+        for n in range(i, 0, -1):
+            dist[n] = dist[n] * q + dist[n - 1] * p
+        dist[0] *= q
+
+    return tuple(dist)
+
+
+def update_cell_state(state: Union[int, float],
+                      neighbor_states: list,
+                      s_probs: list,
+                      b_probs: list):
+    """
+    Calculate the new state of a single cell from its current state and the
+    states of its neighbors.
+
+    This is the scalar kernel behind `Cell.update_state`. It takes the Poisson
+    binomial distribution of the neighbors from `poisson_binomial_pmf` and sums
+    the survival and birth terms on plain Python floats, which avoids the
+    overhead of numpy operations on arrays as small as the eight neighbors of
+    a cell.
+
+    Parameters
+    ----------
+    state: int | float
+        The current state of the cell.
+
+    neighbor_states: list
+        The states of the neighboring cells.
+
+    s_probs: list
+        The survival probabilities by number of neighbors.
+
+    b_probs: list
+        The birth probabilities by number of neighbors.
+
+    Returns
+    -------
+    new_state: float
+        The new state of the cell, before rounding.
+    """
+
+    # Retrieve the distribution of the number of alive neighbors
+    dist = poisson_binomial_pmf(tuple(sorted(neighbor_states)))
+
+    # Add the survival and birth terms of all numbers of neighbors
+    new_state = 0.0
+    for Nt, s_prob, b_prob in zip(dist, s_probs, b_probs):
+        new_state += Nt * (s_prob * state + b_prob * (1 - state))
+
+    return new_state
+
+
 class Cell:
     """
     A class representing a cell inside the grid of the Game of Life or its
@@ -75,6 +219,25 @@ class Cell:
     def __call__(self):
         return self.state
 
+    @classmethod
+    def _unchecked(cls,
+                   row: int,
+                   col: int,
+                   state: Union[int, float]):
+        """
+        Create a Cell without validating its parameters.
+
+        This constructor is meant for internal use, where the row, column and
+        state of the cell are known to be valid, such as when cells are read
+        from the states of a grid.
+        """
+
+        cell = cls.__new__(cls)
+        cell.row = row
+        cell.col = col
+        cell.state = state
+        return cell
+
     def calculate_alive_neighbors(self,
                                   n_neighbors: int,
                                   neighboring_cells: list):
@@ -82,12 +245,12 @@ class Cell:
         Calculate the total probability of a cell having exactly 'n' alive
         neighbors.
 
-        This method computes the total probability of a cell having exactly
-        'n' alive neighbors by iterating over all possible combinations of
-        'n' neighbors. For each combination, it calculates the product of
-        the probabilities that the selected neighbors are alive and that the
-        remaining neighbors are dead. These individual probabilities for each
-        combination are then added together to obtain the total probability.
+        This method reads the probability of a cell having exactly 'n' alive
+        neighbors from the Poisson binomial distribution of its neighbors. The
+        distribution is computed in a single pass for all values of 'n' and
+        memoized, so that calling this method for every 'n' with the same
+        neighbors reuses the probabilities of the neighbors being alive and
+        dead instead of recomputing them for each 'n'.
 
         Parameters
         ----------
@@ -105,29 +268,23 @@ class Cell:
             This is a float value in the range of [0, 1].
         """
 
-        # Total alive probability for current cell
-        cell_alive_prob = 0.0
-
-        # Pre-calculate the products of all neighboring cell states and their complements
-        products = [cell.state for cell in neighboring_cells]
-        complements = [1 - p for p in products]
+        # Retrieve the distribution of the number of alive neighbors
+        dist = poisson_binomial_pmf(tuple(sorted(float(cell.state)
+                                                 for cell in neighboring_cells)))
 
-        # Loop over all combinations of n neighbors
-        for combination in itertools.combinations(range(len(neighboring_cells)), n_neighbors):
-            # Calculate the probability of this combination being alive
-            alive_prob = math.prod(products[i] for i in combination)
+        # There cannot be more alive neighbors than neighbors
+        if n_neighbors >= len(dist):
+            return 0.0
 
-            # Calculate the probability of the other cells being dead
-            dead_prob = math.prod(complements[i] for i in range(len(neighboring_cells))
-                                  if i not in combination)
-
-            # Add the probability of this combination to the total probability
-            cell_alive_prob += alive_prob * dead_prob
+        # Total alive probability for current cell
+        cell_alive_prob = dist[n_neighbors]
 
         return cell_alive_prob
 
     def update_state(self,
-                     neighboring_cells: list):
+                     neighboring_cells: list,
+                     s_probs: np.ndarray | None = None,
+                     b_probs: np.ndarray | None = None):
         """
         Update the state of the cell.
 
@@ -136,13 +293,25 @@ class Cell:
         (0 to 8 inclusive), it calculates the contribution to the new state.
         The contribution depends on the survival and birth probabilities for
         that number of neighbors and the probability of the cell having that
-        many neighbors alive.
+        many neighbors alive. The latter probabilities are all obtained in a
+        single pass from the Poisson binomial distribution of the neighbors,
+        computed by the `update_cell_state` kernel.
 
         Parameters
         ----------
         neighboring_cells: list
             A list of neighboring cells represented by Cell objects.
 
+        s_probs: np.ndarray | None, default=None
+            The survival probabilities by number of neighbors, as returned by
+            `Rule.get_probabilities_by_neighbors`. If not provided, they are
+            retrieved from the currently defined rules.
+
+        b_probs: np.ndarray | None, default=None
+            The birth probabilities by number of neighbors, as returned by
+            `Rule.get_probabilities_by_neighbors`. If not provided, they are
+            retrieved from the currently defined rules.
+
         Returns
         -------
         new_state: float
@@ -151,31 +320,15 @@ class Cell:
             the probability of the cell being alive in the next generation.
         """
 
-        # Retrieve the rules for survival and birth conditions
-        rules_by_neighbors = Rule.get_rules_by_neighbors()
-
-        # Define the new state of the cell
-        new_state = 0
-
-        # Iterate over all possible number of neighbors (0 to 8 inclusive)
-        for n_neighbors in range(9):
-            # If there are rules defined for the current number of neighbors
-            if n_neighbors in list(rules_by_neighbors.keys()):
-                # Calculate the total probability of exactly n neighbors being alive
-                Nt = self.calculate_alive_neighbors(n_neighbors, neighboring_cells)
-
-                # Iterate over the rules defined for the current number of neighbors
-                s_term, b_term = 0, 0
-                for rule in rules_by_neighbors[n_neighbors]:
-                    # If it's a survival rule, calculate the survival term
-                    if rule.condition == "s":
-                        s_term = rule.probability * self.state
-                    # If it's a birth rule, calculate the birth term
-                    if rule.condition == "b":
-                        b_term = rule.probability * (1 - self.state)
+        # Retrieve the survival and birth probabilities if not provided
+        if s_probs is None or b_probs is None:
+            s_probs, b_probs = Rule.get_probabilities_by_neighbors()
 
-                # Add the contribution of the current number of neighbors to the new state
-                new_state += Nt * (s_term + b_term)
+        # Calculate the new state from the states of the neighboring cells
+        new_state = update_cell_state(self.state,
+                                      [round(float(cell.state), 2) for cell in neighboring_cells],
+                                      np.asarray(s_probs).tolist(),
+                                      np.asarray(b_probs).tolist())
 
         # Return the new state, rounded to 2 decimal places
-        return np.round(new_state, 2)
+        return round(new_state, 2)
@@ -23,13 +23,444 @@ rules, users can explore and observe the dynamic patterns and behaviors that
 emerge within the Game of Life cellular automaton and its variant Problife.
 """
 
-import copy
+import collections
+import functools
 
 import numpy as np
 
-from life.modules.cell import Cell
+from life.modules.cell import Cell, poisson_binomial
 from life.modules.rule import Rule
 
+# The offsets representing the positions of the eight neighboring cells
+NEIGHBOR_OFFSETS = tuple((i, j) for i in range(-1, 2) for j in range(-1, 2)
+                         if not i == j == 0)
+
+# The largest grid size whose rows fit in the bytes of a single 64-bit word
+MAX_PACKED_SIZE = 8
+
+# The smallest grid size from which packing the rows into 64-bit words is
+# faster than counting the neighbors of a binary grid cell by cell
+MIN_PACKED_ROWS_SIZE = 128
+
+
+def pack_rows(alive: np.ndarray):
+    """
+    Pack the rows of a binary grid into 64-bit words, one bit per cell.
+
+    Every row is packed into `ceil(size / 64)` words, so that the cell at
+    column j of a row is bit j % 64 of word j // 64 of the row. The bits past
+    the last column of a row are zero.
+
+    Parameters
+    ----------
+    alive: np.ndarray
+        A 2D numpy array that is nonzero for the live cells.
+
+    Returns
+    -------
+    words: np.ndarray
+        A 2D numpy array of 64-bit unsigned integers, with one row of words
+        per row of the grid.
+    """
+
+    n_rows, size = alive.shape
+
+    # Pad the rows of the grid to a whole number of words
+    padded = np.zeros((n_rows, -(-size // 64) * 64), dtype=bool)
+    padded[:, :size] = alive
+
+    # Pack eight cells per byte and eight bytes per word, in little endian order
+    words = np.packbits(padded, axis=1, bitorder="little").view("<u8")
+
+    return words.astype(np.uint64)
+
+
+def unpack_rows(words: np.ndarray,
+                size: int):
+    """
+    Unpack the rows of a binary grid from 64-bit words, as packed by
+    `pack_rows`.
+
+    Parameters
+    ----------
+    words: np.ndarray
+        A 2D numpy array of 64-bit unsigned integers, with one row of words
+        per row of the grid.
+
+    size: int
+        The number of columns of the grid.
+
+    Returns
+    -------
+    alive: np.ndarray
+        A 2D numpy array of 8-bit integers, with 1 for the live cells and 0
+        for the dead cells.
+    """
+
+    # Split every word into its bytes, in little endian order
+    row_bytes = np.ascontiguousarray(words, dtype="<u8").view(np.uint8)
+
+    return np.unpackbits(row_bytes, axis=1, count=size, bitorder="little")
+
+
+@functools.lru_cache(maxsize=None)
+def packed_masks(size: int):
+    """
+    Calculate the bit masks of a grid packed by rows into the bytes of an
+    integer, as done by `step_bits`.
+
+    Parameters
+    ----------
+    size: int
+        The size of the grid, at most `MAX_PACKED_SIZE`.
+
+    Returns
+    -------
+    full: int
+        The mask of all the cells of the grid.
+
+    first_col: int
+        The mask of the cells in the first column of the grid.
+
+    last_col: int
+        The mask of the cells in the last column of the grid.
+    """
+
+    first_col = sum(1 << 8 * i for i in range(size))
+    last_col = first_col << size - 1
+    full = first_col * ((1 << size) - 1)
+
+    return full, first_col, last_col
+
+
+def step_bits(bits: int,
+              size: int,
+              births,
+              survivals):
+    """
+    Compute the next generation of a small binary grid packed into the bits
+    of an integer, under deterministic rules.
+
+    Row i of the grid occupies the byte of bits i*8 to i*8+7, and the cell at
+    column j of the row is bit i*8+j. The eight neighbor grids are obtained by
+    shifting the whole word by one column and one row, wrapping around the
+    edges of the grid. The neighbor counts of all cells are then added bitwise
+    by a tree of full and half adders into four bit planes, so that the whole
+    generation takes a few dozen integer operations.
+
+    Parameters
+    ----------
+    bits: int
+        The packed states of the cells, with 1 for alive and 0 for dead.
+
+    size: int
+        The size of the grid, at most `MAX_PACKED_SIZE`.
+
+    births: iterable
+        The numbers of live neighbors for which a dead cell is born.
+
+    survivals: iterable
+        The numbers of live neighbors for which a live cell survives.
+
+    Returns
+    -------
+    new_bits: int
+        The packed states of the cells at the next generation.
+    """
+
+    full, first_col, last_col = packed_masks(size)
+    row_shift = 8 * (size - 1)
+
+    # Shift the states by one column in both directions, wrapping the
+    # columns of the edges around
+    east = ((bits << 1) & full & ~first_col) | ((bits >> size - 1) & first_col)
+    west = ((bits >> 1) & full & ~last_col) | ((bits << size - 1) & last_col)
+
+    # Shift the states and their column shifts by one row in both
+    # directions, wrapping the rows of the edges around
+    n0 = ((bits << 8) | (bits >> row_shift)) & full
+    n1 = ((bits >> 8) | (bits << row_shift)) & full
+    n2 = ((east << 8) | (east >> row_shift)) & full
+    n3 = ((east >> 8) | (east << row_shift)) & full
+    n4 = ((west << 8) | (west >> row_shift)) & full
+    n5 = ((west >> 8) | (west << row_shift)) & full
+
+    # Count the live neighbors and apply the rules to all cells at once
+    new_bits = apply_rule_bits(bits, (east, west, n0, n1, n2, n3, n4, n5), births, survivals)
+
+    return new_bits & full
+
+
+def step_packed_rows(words: np.ndarray,
+                     size: int,
+                     births,
+                     survivals):
+    """
+    Compute the next generation of a binary grid whose rows are packed into
+    64-bit words, as done by `pack_rows`, under deterministic rules.
+
+    This is the counterpart of `step_bits` for grids of any size. The eight
+    neighbor grids are obtained by shifting the words of every row by one
+    bit, carrying the bits across the words of the row, and by rolling the
+    rows. The neighbor counts are then added by `apply_rule_bits`, so that
+    every numpy operation processes 64 cells per word.
+
+    Parameters
+    ----------
+    words: np.ndarray
+        A 2D numpy array of 64-bit unsigned integers, with one row of words
+        per row of the grid.
+
+    size: int
+        The number of columns of the grid.
+
+    births: iterable
+        The numbers of live neighbors for which a dead cell is born.
+
+    survivals: iterable
+        The numbers of live neighbors for which a live cell survives.
+
+    Returns
+    -------
+    new_words: np.ndarray
+        The packed states of the cells at the next generation.
+    """
+
+    one, top = np.uint64(1), np.uint64(63)
+    last_word, last_bit = divmod(size - 1, 64)
+
+    # Mask of the bits of the words of a row that hold cells
+    row_mask = np.full(words.shape[1], ~np.uint64(0))
+    row_mask[-1] >>= np.uint64(63 - last_bit)
+
+    # Shift the rows by one column towards the end of the row, carrying the
+    # last bit of each word into the next one, and wrap the last column
+    east = words << one
+    east[:, 1:] |= words[:, :-1] >> top
+    east[:, 0] |= (words[:, last_word] >> np.uint64(last_bit)) & one
+    east &= row_mask
+
+    # Shift the rows by one column towards the start of the row, carrying
+    # the first bit of each word into the previous one, and wrap the first
+    # column
+    west = words >> one
+    west[:, :-1] |= words[:, 1:] << top
+    west[:, last_word] |= (words[:, 0] & one) << np.uint64(last_bit)
+
+    # Roll the states and their column shifts by one row in both directions
+    neighbors = [east, west]
+    for cols in (words, east, west):
+        neighbors.append(np.roll(cols, 1, axis=0))
+        neighbors.append(np.roll(cols, -1, axis=0))
+
+    # Count the live neighbors and apply the rules to all cells at once
+    new_words = apply_rule_bits(words, neighbors, births, survivals)
+
+    return new_words & row_mask
+
+
+def apply_rule_bits(bits,
+                    neighbors,
+                    births,
+                    survivals):
+    """
+    Compute the next states of binary cells packed into bits, given the
+    packed states of their eight neighbors, under deterministic rules.
+
+    The neighbor counts of all cells are added bitwise by a tree of full and
+    half adders into four bit planes, holding the bits of weight 1, 2, 4 and
+    8 of the counts. The cells that are born or survive are then those whose
+    planes match the bits of one of the numbers of neighbors of the rules.
+    This works alike on Python integers and on numpy arrays of integers.
+
+    Parameters
+    ----------
+    bits: int | np.ndarray
+        The packed states of the cells, with 1 for alive and 0 for dead.
+
+    neighbors: sequence
+        The packed states of the eight neighbors of the cells, each aligned
+        with `bits`.
+
+    births: iterable
+        The numbers of live neighbors for which a dead cell is born.
+
+    survivals: iterable
+        The numbers of live neighbors for which a live cell survives.
+
+    Returns
+    -------
+    new_bits: int | np.ndarray
+        The packed states of the cells at the next generation. The bits that
+        do not hold cells are undefined and should be masked out.
+    """
+
+    n0, n1, n2, n3, n4, n5, n6, n7 = neighbors
+
+    # Add the neighbor grids of weight 1 by threes with full adders
+    x = n0 ^ n1
+    s0, c0 = x ^ n2, (n0 & n1) | (x & n2)
+    x = n3 ^ n4
+    s1, c1 = x ^ n5, (n3 & n4) | (x & n5)
+    s2, c2 = n6 ^ n7, n6 & n7
+    x = s0 ^ s1
+    ones, c3 = x ^ s2, (s0 & s1) | (x & s2)
+
+    # Add the carries of weight 2, then those of weight 4
+    x = c0 ^ c1
+    t, d0 = x ^ c2, (c0 & c1) | (x & c2)
+    twos, d1 = t ^ c3, t & c3
+    fours, eights = d0 ^ d1, d0 & d1
+    planes = (ones, twos, fours, eights)
+
+    # Set the cells whose number of live neighbors matches a rule
+    new_bits = bits & 0
+    for n, alive in [(n, ~bits) for n in births] + [(n, bits) for n in survivals]:
+        matches = alive
+        for k, plane in enumerate(planes):
+            matches = matches & (plane if n >> k & 1 else ~plane)
+        new_bits = new_bits | matches
+
+    return new_bits
+
+
+class GridCell(Cell):
+    """
+    A cell of a `GridView`, whose state is read from and written to the array
+    of states viewed by the grid, instead of being held by the cell.
+
+    Parameters
+    ----------
+    view: GridView
+        The view of the grid that the cell belongs to.
+
+    row: int
+        The row coordinate of the cell within the grid.
+
+    col: int
+        The column coordinate of the cell within the grid.
+    """
+
+    def __init__(self,
+                 view: "GridView",
+                 row: int,
+                 col: int):
+        self.view = view
+        self.row = row
+        self.col = col
+
+    @property
+    def state(self):
+        return self.view.states[self.row, self.col] / self.view.game.STATE_SCALE
+
+    @state.setter
+    def state(self, value):
+        self.view.set_state(self.row, self.col, value)
+
+
+class GridView:
+    """
+    A lightweight view of the grid of a GameOfLife simulation as Cell objects.
+
+    The view does not hold any Cell objects. Each Cell is created on demand,
+    when it is accessed, at its position in the array of states of the game.
+    This way, Cell objects are only built for the cells that are actually
+    used. The state of such a Cell is read from the array of states, and
+    setting it writes to the array, so that it changes the grid. Like a 2D
+    numpy array, the view can be indexed by `grid[i, j]` or `grid[i][j]`,
+    and iterating over it yields its rows.
+
+    Parameters
+    ----------
+    game: GameOfLife
+        The game whose grid is viewed.
+
+    name: str, default="states"
+        The name of the attribute of the game that holds the viewed states,
+        such as "states", "initial_states" or "previous_states".
+    """
+
+    def __init__(self,
+                 game: "GameOfLife",
+                 name: str = "states"):
+        self.game = game
+        self.name = name
+
+    def __len__(self):
+        return self.game.grid_size
+
+    def __getitem__(self, index):
+        # Return a single cell for a pair of indices
+        if isinstance(index, tuple):
+            row, col = index
+            return self.get_cell(row, col)
+
+        # Otherwise, return the cells of a row
+        return [self.get_cell(index, col) for col in range(len(self))]
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self[row]
+
+    @property
+    def shape(self):
+        return self.states.shape
+
+    @property
+    def states(self):
+        return getattr(self.game, self.name)
+
+    def get_cell(self,
+                 row: int,
+                 col: int):
+        """
+        Create the Cell at the given position of the grid.
+
+        Parameters
+        ----------
+        row: int
+            The row coordinate of the cell within the grid.
+
+        col: int
+            The column coordinate of the cell within the grid.
+
+        Returns
+        -------
+        cell: GridCell
+            A Cell whose state is the state at the given position.
+        """
+
+        return GridCell(self, int(row) % len(self), int(col) % len(self))
+
+    def set_state(self,
+                  row: int,
+                  col: int,
+                  state: int | float):
+        """
+        Set the state of the cell at the given position of the grid.
+
+        Parameters
+        ----------
+        row: int
+            The row coordinate of the cell within the grid.
+
+        col: int
+            The column coordinate of the cell within the grid.
+
+        state: int | float
+            The new state of the cell, in the range [0, 1].
+        """
+
+        if not 0 <= state <= 1:
+            raise ValueError("State must be a float between 0 and 1 (inclusive)")
+
+        # Write the state in hundredths into the viewed states
+        self.states[row, col] = round(state * self.game.STATE_SCALE)
+
+        # The states of the simulation are modified outside of its updates
+        if self.name == "states":
+            self.game._mark_modified()
+
 
 class GameOfLife:
     """
@@ -50,24 +481,60 @@ class GameOfLife:
     alive_percentage: float
         The percentage of cells that are initially alive.
 
-    grid: np.array
-        The cellular automaton grid, represented as a 2D numpy array of Cell
-        objects.
+    states: np.ndarray
+        The states of the cells of the grid, represented as a 2D numpy array
+        of 8-bit integers that hold the states in hundredths, from 0 (dead) to
+        100 (alive). This array is the source of truth for the simulation.
+        Use `grid_to_array` to obtain the states as floats in [0, 1].
+
+    grid: GridView
+        The cellular automaton grid, represented as a view of Cell objects.
+        The Cell objects are created on demand from `states`, and setting
+        their state changes `states`. A grid of Cell objects or an array of
+        states in [0, 1] can also be assigned to it.
+
+    initial_states: np.ndarray
+        The states of the cells at the initial generation.
+
+    initial_grid: GridView
+        The grid at the initial generation, as a view of `initial_states`.
+
+    previous_states: np.ndarray
+        The states of the cells at the previous generation.
 
-    initial_grid: np.array
-        The state of the grid at the initial generation.
+    previous_grid: GridView
+        The grid at the previous generation, as a view of `previous_states`.
 
-    previous_grid: np.array
-        The state of the grid from the previous generation.
+    history: collections.deque
+        The states of the cells at the most recent previous generations, up
+        to `HISTORY_SIZE` of them, from the oldest to the newest. The states
+        of binary grids are packed by `pack_rows`, one bit per cell.
 
     rules: dict
         The rules that determine the transitions, stored as a dictionary
         mapping from integers to Rule objects.
 
+    s_probs: np.ndarray
+        The survival probabilities of the rules by number of neighbors.
+
+    b_probs: np.ndarray
+        The birth probabilities of the rules by number of neighbors.
+
     time_step: int
         The current time step of the simulation.
+
+    stable: bool
+        Whether the last grid update led to a still life or to an oscillator
+        of period 2, that is, the grid repeats one of its two previous states.
     """
 
+    # CONSTANTS
+    # Number of quantization levels of a state between dead and alive.
+    # States are rounded to two decimal places, so they fit in 8-bit integers.
+    STATE_SCALE = 100
+    # Maximum number of previous generations kept to step backwards
+    HISTORY_SIZE = 1024
+
     def __init__(self,
                  variant: str = "original"):
         self.variant = variant
@@ -75,11 +542,95 @@ class GameOfLife:
         # Initialize instance attributes to None as default.
         self.grid_size = None
         self.alive_percentage = None
-        self.grid = None
-        self.initial_grid = None
-        self.previous_grid = None
+        self.states = None
+        self.initial_states = None
+        self.previous_states = None
+        self.history = collections.deque(maxlen=self.HISTORY_SIZE)
         self.rules = None
+        self.s_probs = None
+        self.b_probs = None
         self.time_step = 0
+        self.stable = False
+
+        # Row and column indices of the grid extended by one cell on each
+        # side, wrapped around the edges to follow the toroidal configuration
+        self._wrap_index = None
+
+        # Next state of a binary cell, indexed by its number of live neighbors
+        # plus 9 if it is alive, when all the rules are deterministic
+        self._transition_table = None
+
+        # Numbers of neighbors for which a binary cell is born and survives,
+        # when all the rules are deterministic
+        self._packed_rules = None
+
+        # Numbers of neighbors for which at least one rule applies
+        self._rule_counts = None
+
+        # Preallocated buffer for the neighbor counts of binary grids
+        self._scratch = None
+
+        # States at the time step before the previous one, as of the last
+        # grid update, and whether the states have been modified outside of
+        # the grid updates since then
+        self._older_states = None
+        self._modified = False
+
+        # Whether every cell is either dead or alive, and the rows of the
+        # states packed into 64-bit words, as of the last grid update. Each
+        # is None when it is unknown.
+        self._binary = None
+        self._packed_states = None
+
+    @property
+    def grid(self):
+        """
+        The grid as a view of Cell objects, which are only created when they
+        are accessed, from the current states of the cells.
+        """
+
+        return self.view_grid("states")
+
+    @grid.setter
+    def grid(self, grid):
+        self.states = self.grid_to_states(grid)
+        self._mark_modified()
+
+    @property
+    def initial_grid(self):
+        """
+        The grid at the initial generation, as a view of Cell objects.
+        """
+
+        return self.view_grid("initial_states")
+
+    @initial_grid.setter
+    def initial_grid(self, grid):
+        self.initial_states = self.grid_to_states(grid)
+
+    @property
+    def previous_grid(self):
+        """
+        The grid at the previous generation, as a view of Cell objects.
+        """
+
+        return self.view_grid("previous_states")
+
+    @previous_grid.setter
+    def previous_grid(self, grid):
+        self.previous_states = self.grid_to_states(grid)
+
+    def _mark_modified(self):
+        """
+        Mark the states as modified outside of `update_grid`, so that the
+        next update does not compare the new states with those preceding
+        the modification.
+        """
+
+        self._modified = True
+        self.stable = False
+        self._binary = None
+        self._packed_states = None
 
     def count_live_neighbors(self,
                              cell: Cell):
@@ -97,27 +648,28 @@ class GameOfLife:
 
         Returns
         -------
-        live_neighbor_count: int
-            Number of live neighbors.
+        live_neighbor_count: int | float
+            Number of live neighbors. In Problife, this is the sum of the
+            states of the neighbors, which is a float.
         """
 
         # Initialize the live_neighbor_count to 0
         live_neighbor_count = 0
 
-        # Define the offsets representing the positions of the eight
-        # neighboring cells.
-        offsets = [(i, j) for i in range(-1, 2) for j in range(-1, 2)
-                   if not i == j == 0]
-
         # Iterate through the possible neighbor offsets
-        for delta_i, delta_j in offsets:
-            # Calculate the indices of the neighbor cell
-            neighbor_i = (cell.row + delta_i) % self.grid_size
-            neighbor_j = (cell.col + delta_j) % self.grid_size
+        for delta_i, delta_j in NEIGHBOR_OFFSETS:
+            # Look up the indices of the neighbor cell
+            neighbor_i = self._wrap_index[cell.row + 1 + delta_i]
+            neighbor_j = self._wrap_index[cell.col + 1 + delta_j]
             # Add the state of the neighbor cell to the live_neighbor_count
-            live_neighbor_count += self.grid[neighbor_i][neighbor_j].state
+            live_neighbor_count += int(self.states[neighbor_i, neighbor_j])
 
-        return live_neighbor_count
+        # Convert the sum of the states from hundredths, keeping whole
+        # numbers of neighbors in the original Game of Life
+        if self.variant == "original":
+            return live_neighbor_count // self.STATE_SCALE
+
+        return live_neighbor_count / self.STATE_SCALE
 
     def get_neighboring_cells(self,
                               cell: Cell):
@@ -143,34 +695,67 @@ class GameOfLife:
         # Initialize the list for neighboring cells
         neighboring_cells = []
 
-        # Define the offsets representing the positions of the eight
-        # neighboring cells.
-        offsets = [(i, j) for i in range(-1, 2) for j in range(-1, 2)
-                   if not i == j == 0]
-
         # Iterate through the possible neighbor offsets
-        for delta_i, delta_j in offsets:
-            # Calculate the indices of the neighbor cell
-            neighbor_i = (cell.row + delta_i) % self.grid_size
-            neighbor_j = (cell.col + delta_j) % self.grid_size
+        for delta_i, delta_j in NEIGHBOR_OFFSETS:
+            # Look up the indices of the neighbor cell
+            neighbor_i = self._wrap_index[cell.row + 1 + delta_i]
+            neighbor_j = self._wrap_index[cell.col + 1 + delta_j]
             # Append the neighbor cell to the list
-            neighboring_cells.append(self.grid[neighbor_i][neighbor_j])
+            neighboring_cells.append(Cell._unchecked(int(neighbor_i), int(neighbor_j),
+                                                     self.states[neighbor_i, neighbor_j]
+                                                     / self.STATE_SCALE))
 
         return neighboring_cells
 
+    def get_neighbor_states(self,
+                            states: np.ndarray):
+        """
+        Return the states of the neighbors of every cell in the grid.
+
+        This method extends the array of states by one cell on each side,
+        wrapping around the edges to keep the toroidal configuration, and
+        takes the eight windows of the extended array that are shifted by one
+        position towards each neighboring direction. Element (k, i, j) of the
+        result is the state of the k-th neighbor of the cell at row i and
+        column j.
+
+        Parameters
+        ----------
+        states: np.ndarray
+            A 2D numpy array with the states of the cells.
+
+        Returns
+        -------
+        neighbor_states: np.ndarray
+            A 3D numpy array of shape (8, grid_size, grid_size) that contains
+            the states of the neighbors of every cell.
+        """
+
+        # Extend the states with the wrapped rows and columns of the edges
+        extended = states[np.ix_(self._wrap_index, self._wrap_index)]
+
+        # Stack the shifted windows of the extended states along the first axis
+        n = self.grid_size
+        neighbor_states = np.stack([extended[1 + delta_i:1 + delta_i + n,
+                                             1 + delta_j:1 + delta_j + n]
+                                    for delta_i, delta_j in NEIGHBOR_OFFSETS])
+
+        return neighbor_states
+
     def grid_to_array(self,
-                      grid: np.ndarray):
+                      grid: np.ndarray | None = None):
         """
         Converts a grid of cells to a numpy array with elements representing
         the state of the corresponding cell at each position.
 
-        This method expects a grid as input where each element is an object
-        of the 'Cell' class. It then reads the state of each cell, creates
-        and returns a 2D numpy array.
+        If no grid is given, this method returns the current states of the
+        cells as floats in [0, 1]. Otherwise, it expects a grid as input where
+        each element is an object of the 'Cell' class. It then reads the state
+        of each cell, creates and returns a 2D numpy array.
 
         Parameters
         ----------
-        grid: np.ndarray
+        grid: np.ndarray | None, default=None
             The grid to convert to a numpy array.
             Each element of the grid should be a 'Cell' object.
 
@@ -181,12 +766,43 @@ class GameOfLife:
             represents the state of the corresponding cell in the input grid.
         """
 
+        # Convert the current states of the cells if no grid is given
+        if grid is None:
+            return self.states / self.STATE_SCALE
+
         # Convert the grid to a numpy array by iterating over each row and
         # each cell in the row and extracting the 'state' of each cell.
         np_grid = np.array([[cell.state for cell in row] for row in grid])
 
         return np_grid
 
+    def grid_to_states(self,
+                       grid):
+        """
+        Converts a grid of cells, or an array of states in [0, 1], to states
+        in hundredths, as held by `states`.
+
+        Parameters
+        ----------
+        grid: np.ndarray | GridView | list | None
+            The grid to convert, either of 'Cell' objects or of states.
+
+        Returns
+        -------
+        states: np.ndarray | None
+            A 2D numpy array of 8-bit integers with the states of the cells in
+            hundredths, or None if no grid is given.
+        """
+
+        if grid is None:
+            return None
+
+        # Read the states of the cells, unless the grid holds states already
+        if isinstance(grid, GridView) or isinstance(np.asarray(grid, dtype=object).flat[0], Cell):
+            grid = self.grid_to_array(grid)
+
+        return np.rint(np.asarray(grid, dtype=float) * self.STATE_SCALE).astype(np.uint8)
+
     def initialize_grid(self,
                         grid_size: int = 10,
                         alive_percentage: float = 0.2,
@@ -195,8 +811,8 @@ class GameOfLife:
         Initializes the grid with a randomized distribution of live and dead
         cells.
 
-        This method creates a two-dimensional numpy array of Cell objects to
-        represent the grid. The state of each cell is initially determined
+        This method creates a two-dimensional numpy array with the states of
+        the cells of the grid. The state of each cell is initially determined
         randomly, based on the `alive_percentage` parameter. This proportion
         dictates the likelihood that a cell will start in the "alive" state.
         If a seed is provided, it is used to initialize the random number
@@ -236,6 +852,12 @@ class GameOfLife:
         self.grid_size = grid_size
         self.alive_percentage = alive_percentage
 
+        # Cache the wrapped indices used to look up the neighbors of cells
+        self._wrap_index = np.arange(-1, grid_size + 1) % grid_size
+
+        # Allocate the buffer for the neighbor counts once for this grid size
+        self._scratch = np.empty((grid_size, grid_size), dtype=np.uint8)
+
         # Set the seed for the RNG
         np.random.seed(seed)
 
@@ -244,15 +866,16 @@ class GameOfLife:
                                           size=(grid_size, grid_size),
                                           p=[1 - alive_percentage, alive_percentage])
 
-        # Initialize a grid of Cell objects based on the initial_states
-        grid = [[Cell(i, j, state) for j, state in enumerate(row)]
-                for i, row in enumerate(initial_states)]
+        # Set the initial states as the states of the grid
+        self.states = (initial_states * self.STATE_SCALE).astype(np.uint8)
 
-        # Convert the grid to a numpy array and set it as the grid attribute
-        self.grid = np.array(grid)
+        # Keep a copy of the initial states
+        self.initial_states = self.states.copy()
 
-        # Keep a copy of the initial grid
-        self.initial_grid = copy.deepcopy(self.grid)
+        # Forget the history of any previous grid
+        self.previous_states = None
+        self.history.clear()
+        self._mark_modified()
 
     def is_life_extinct(self):
         """
@@ -264,11 +887,8 @@ class GameOfLife:
             True if all cells are dead, False otherwise.
         """
 
-        # Convert the grid to a numpy array
-        np_grid = self.grid_to_array(self.grid)
-
-        # Check if all cells are dead
-        extinction_reached = np.all(np_grid == 0)
+        # Check if all cells are dead, directly on the array of states
+        extinction_reached = not self.states.any()
 
         return extinction_reached
 
@@ -280,15 +900,14 @@ class GameOfLife:
         Returns
         -------
         equilibrium_reached: bool
-            True if the grid state is unchanged, False otherwise.
+            True if the grid state is unchanged, False otherwise, including
+            when there is no previous time step.
         """
 
-        # Convert the grids to numpy arrays
-        curr_grid = self.grid_to_array(self.grid)
-        prev_grid = self.grid_to_array(self.previous_grid)
-
-        # Check if the grid state is unchanged
-        equilibrium_reached = np.array_equal(curr_grid, prev_grid)
+        # Check if the grid state is unchanged, comparing the state arrays
+        # directly without converting them
+        equilibrium_reached = (self.previous_states is not None
+                               and np.array_equal(self.states, self.previous_states))
 
         return equilibrium_reached
 
@@ -296,17 +915,34 @@ class GameOfLife:
         """
         Clean the grid by setting all elements to zero.
 
-        This function will set all elements in the 'grid' and 'previous_grid'
-        attributes to zero, effectively clearing all living cells and resetting
-        the simulation to an initial blank state.
+        This function will set all elements in the 'states' attribute to zero
+        and discard the 'previous_states' and the 'history', effectively clearing
+        all living cells and resetting the simulation to an initial blank state.
         """
 
         # Convert every cell in the grid to 0
-        for row in self.grid:
-            for cell in row:
-                cell.state = 0
+        self.states.fill(0)
+
+        self.previous_states = None
+        self.history.clear()
+        self._mark_modified()
+
+    def restore_initial(self):
+        """
+        Restore the grid to its initial states.
+
+        This function copies the 'initial_states' into the 'states' and
+        discards the 'previous_states' and the 'history', so that the
+        simulation starts over from the initial generation.
+        """
 
-        self.previous_grid = None
+        # Copy the initial states into the grid
+        np.copyto(self.states, self.initial_states)
+
+        self.previous_states = None
+        self.history.clear()
+        self.time_step = 0
+        self._mark_modified()
 
     def set_rules(self,
                   original_rules: bool = True,
@@ -350,7 +986,10 @@ class GameOfLife:
             if rules is None:
                 raise ValueError("If original_rules is False, custom rules must be provided.")
             self.rules = rules
-            Rule.rules = rules
+            Rule.set_rules(rules)
+
+        # Tabulate the probabilities of the new rules
+        self.tabulate_rules()
 
     def set_custom_grid(self,
                         new_grid: np.ndarray):
@@ -372,10 +1011,11 @@ class GameOfLife:
         assert new_grid.shape == (self.grid_size, self.grid_size), \
             "The shape of new_grid should match the initialized grid size."
 
-        # Update the state of each cell in the grid
-        for i, row in enumerate(new_grid):
-            for j, value in enumerate(row):
-                self.grid[i][j].state = value
+        # Update the states of the cells in the grid
+        self.states[...] = np.rint(np.asarray(new_grid) * self.STATE_SCALE)
+
+        # Mark the states as replaced
+        self._mark_modified()
 
     def simulate(self,
                  max_iter: int | None = 100,
@@ -392,6 +1032,10 @@ class GameOfLife:
         2. Equilibrium: The state of the grid has not changed between iterations.
         3. Max Iterations: The number of iterations has reached `max_iter`.
 
+        The equilibrium check relies on the `stable` flag that is set by
+        `update_grid`, so that the grid is only compared with its previous
+        state once more when it repeats one of its recent states.
+
         Parameters
         ----------
         max_iter : int | None, default=100
@@ -416,8 +1060,9 @@ class GameOfLife:
                 print(f"Extinction reached after {self.time_step} iterations.\nAborting...")
                 return
 
-            # If equilibrium is reached, return
-            if self.is_life_stable():
+            # If equilibrium is reached, return. The grid can only be
+            # unchanged if it repeats one of its recent states.
+            if self.stable and self.is_life_stable():
                 print(f"Equilibrium reached after {self.time_step} iterations.\nAborting...")
                 return
 
@@ -428,12 +1073,24 @@ class GameOfLife:
 
     def step_backwards(self):
         """
-        Goes the game's state by one time step, updating all cell states
-        in the process.
+        Goes the game's state back by one time step, restoring all cell
+        states in the process.
+
+        The states of the previous generations are kept in the `history` by
+        `update_grid`, so no generation needs to be simulated again. Up to
+        `HISTORY_SIZE` steps can be taken backwards in a row.
         """
 
-        # Store a copy of the current grid for future reference
-        self.grid = copy.deepcopy(self.previous_grid)
+        if not self.history:
+            raise ValueError("No previous generation to step back to")
+
+        # Restore the states of the previous generation
+        self.states = self.unpack_snapshot(self.history.pop())
+        self.previous_states = self.unpack_snapshot(self.history[-1]) if self.history else None
+        self.time_step -= 1
+
+        # Mark the states as restored
+        self._mark_modified()
 
     def step_forward(self):
         """
@@ -441,12 +1098,174 @@ class GameOfLife:
         in the process.
         """
 
-        # Store a copy of the current grid for future reference
-        self.previous_grid = copy.deepcopy(self.grid)
-
-        # Update the grid state
+        # Update the grid state, which also stores a copy of the current
+        # states for future reference
         self.update_grid()
 
+    def sum_neighbor_states(self,
+                            states: np.ndarray,
+                            out: np.ndarray):
+        """
+        Add the states of the neighbors of every cell in the grid to an array.
+
+        The sum over the neighbors of a cell is a 2D convolution of the states
+        with a 3x3 kernel of ones whose center is zero, with wrapped edges.
+        Since the 3x3 kernel of ones is separable, this method first adds the
+        three columns of every horizontal window of the wrap-extended array of
+        states, then adds three consecutive rows of these sums, and finally
+        subtracts the state of the cell itself. This takes five additions over
+        the grid instead of eight, and no array of the eight neighbor states
+        needs to be allocated.
+
+        Parameters
+        ----------
+        states: np.ndarray
+            A 2D numpy array with the states of the cells.
+
+        out: np.ndarray
+            A 2D numpy array of shape (grid_size, grid_size) to which the sums
+            of the neighbor states are added in place. Its data type must be
+            able to hold these sums.
+
+        Returns
+        -------
+        out: np.ndarray
+            The given array, holding the sums of the neighbor states.
+        """
+
+        # Extend the states with the wrapped rows and columns of the edges
+        extended = states[np.ix_(self._wrap_index, self._wrap_index)]
+
+        # Add the three columns of every horizontal window of three cells
+        row_sums = extended[:, :-2] + extended[:, 1:-1]
+        row_sums += extended[:, 2:]
+
+        # Add three consecutive rows of these sums to get the 3x3 block sums
+        np.add(out, row_sums[:-2], out=out)
+        np.add(out, row_sums[1:-1], out=out)
+        np.add(out, row_sums[2:], out=out)
+
+        # Exclude the cell itself from the sums of its neighbors
+        np.subtract(out, states, out=out)
+
+        return out
+
+    def tabulate_rules(self):
+        """
+        Tabulate the rules that are currently defined, for the updates of the
+        grid.
+
+        The survival and birth probabilities of the rules are read once, by
+        number of neighbors, along with the numbers of neighbors that have a
+        rule and, if every rule either always or never applies, the integer
+        transitions of binary cells.
+        """
+
+        # Tabulate the survival and birth probabilities by number of neighbors
+        self.s_probs, self.b_probs = Rule.get_probabilities_by_neighbors()
+
+        # Keep the numbers of neighbors that contribute to the new states,
+        # which are usually only a few of the nine possible ones
+        self._rule_counts = np.flatnonzero(self.s_probs + self.b_probs)
+
+        # If every rule either always or never applies, binary cells remain
+        # binary, so tabulate their next states as integers
+        transitions = np.concatenate([self.b_probs, self.s_probs])
+        if np.all((transitions == 0) | (transitions == 1)):
+            self._transition_table = (transitions * self.STATE_SCALE).astype(np.uint8)
+            self._packed_rules = (np.flatnonzero(self.b_probs).tolist(),
+                                  np.flatnonzero(self.s_probs).tolist())
+        else:
+            self._transition_table = None
+            self._packed_rules = None
+
+    def toggle_cell(self,
+                    row: int,
+                    col: int):
+        """
+        Toggle the state of a cell, from dead to alive and vice versa.
+
+        In Problife, the state of the cell is replaced by its complement, so
+        that the probability of being alive becomes that of being dead.
+
+        Parameters
+        ----------
+        row: int
+            The row coordinate of the cell within the grid.
+
+        col: int
+            The column coordinate of the cell within the grid.
+        """
+
+        # Replace the state of the cell by its complement
+        self.states[row, col] = self.STATE_SCALE - self.states[row, col]
+
+        # Mark the states as modified
+        self._mark_modified()
+
+    def unpack_snapshot(self,
+                        snapshot: np.ndarray):
+        """
+        Recover the states of the cells from a snapshot of the `history`.
+
+        Parameters
+        ----------
+        snapshot: np.ndarray
+            The states of the cells, either as they were, or packed into
+            64-bit words by `pack_rows` if every cell was dead or alive.
+
+        Returns
+        -------
+        states: np.ndarray
+            A 2D numpy array with the states of the cells, in hundredths.
+        """
+
+        # Packed snapshots are told apart by the data type of their words
+        if snapshot.dtype == np.uint64:
+            return unpack_rows(snapshot, self.grid_size) * np.uint8(self.STATE_SCALE)
+
+        return snapshot
+
+    def update_binary_states(self,
+                             states: np.ndarray):
+        """
+        Compute the next generation of a grid whose cells are all either dead
+        (0) or alive (1), under rules that either always or never apply, such
+        as the original rules of the Game of Life.
+
+        The computation is carried out on 8-bit integers. The number of live
+        neighbors of every cell is computed at once, by adding the states of
+        the eight neighbors of every cell, as done by `sum_neighbor_states`,
+        into a buffer that is allocated once per grid. The new state of a cell
+        is then looked up, without any branching, from a table indexed by its
+        neighbor count plus 9 if the cell is alive.
+
+        Parameters
+        ----------
+        states: np.ndarray
+            A 2D numpy array with the binary states of the cells, in hundredths.
+
+        Returns
+        -------
+        new_states: np.ndarray
+            A 2D numpy array with the binary states of the cells at the next
+            generation, in hundredths.
+        """
+
+        # Mark the live cells with 1 and the dead cells with 0
+        alive = (states != 0).view(np.uint8)
+
+        # Start the table index of every cell from 9 if it is alive
+        index = np.multiply(alive, 9, out=self._scratch)
+
+        # Add the number of live neighbors of every cell to its index
+        self.sum_neighbor_states(alive, out=index)
+
+        # Look up the next state of every cell
+        new_states = self._transition_table[index]
+
+        return new_states
+
     def update_grid(self):
         """
         Update the entire grid for the next generation according to the rules
@@ -456,39 +1275,202 @@ class GameOfLife:
         between the new state of a cell and the count of live neighbors for
         its subsequent cells.
 
-        For the "original" variant:
-            - The method first counts the live neighbors for each cell.
-            - Then it updates the state of each cell based on the original
-              rules of the Game of Life.
-
-        For other variants:
-            - The method first gets the states of neighboring cells for each
-              cell and calculates the new state.
-            - Then it updates the state of each cell in the grid with these
-              new states.
+        For binary grids under deterministic rules, such as those of the
+        "original" variant:
+            - The method counts the live neighbors of all cells at once,
+              using a vectorized stencil over the array of cell states.
+            - Then it looks up the new states of all cells from the rules
+              that apply to their neighbor counts.
+            - Grids of up to 8x8 cells are instead packed into the bits of a
+              single integer, and updated by `step_bits`. Grids of at least
+              `MIN_PACKED_ROWS_SIZE` cells per side are packed into 64-bit
+              words per row, and updated by `step_packed_rows`.
+
+        For other grids, such as those of the "problife" variant:
+            - The method computes, for all cells at once, the probabilities
+              of having each possible number of live neighbors.
+            - Then it computes the new states of all cells from the rules
+              weighted by these probabilities.
         """
 
-        # Store a copy of the current grid for future reference
-        self.previous_grid = copy.deepcopy(self.grid)
-
-        # Initialize the updated_states list to store new states of each cell
-        updated_states = [[] for _ in range(self.grid_size)]
-
-        for i, row in enumerate(self.grid):
-            for j, cell in enumerate(row):
-                # Get neighboring cells' states
-                neighboring_states = self.get_neighboring_cells(cell)
-                # Calculate the new state of the cell
-                updated_states[i].append(cell.update_state(neighboring_states))
+        # If no rules have been set, use the rules that are currently defined
+        if self.s_probs is None:
+            self.tabulate_rules()
+
+        # Check whether every cell is either dead or alive, unless it is
+        # known from the last update
+        binary = self._binary
+        if binary is None:
+            binary = bool(np.all((self.states == 0) | (self.states == self.STATE_SCALE)))
+
+        # Pack the rows of binary states, unless they are known packed from
+        # the last update
+        packed_states = self._packed_states
+        if binary and packed_states is None:
+            packed_states = pack_rows(self.states)
+
+        # Keep the current states for future reference. The new states are
+        # always computed into a new array, so the current one needs no copy.
+        # Binary states are kept in the history with one bit per cell.
+        self._older_states = None if self._modified else self.previous_states
+        self.previous_states = self.states
+        self.history.append(packed_states if binary else self.states)
+        self._packed_states = None
+
+        # When every cell is either dead or alive and the rules are
+        # deterministic, the number of alive neighbors of a cell is known
+        # exactly and so is its next state, which is binary as well.
+        if binary and self._transition_table is not None:
+            # Small grids fit in a single 64-bit word, and large grids are
+            # faster to update 64 cells at a time, from their packed rows
+            if self.grid_size <= MAX_PACKED_SIZE:
+                updated_states = self.update_packed_states(self.states)
+            elif self.grid_size >= MIN_PACKED_ROWS_SIZE:
+                self._packed_states = step_packed_rows(packed_states, self.grid_size, *self._packed_rules)
+                updated_states = unpack_rows(self._packed_states, self.grid_size) * np.uint8(self.STATE_SCALE)
+            else:
+                updated_states = self.update_binary_states(self.states)
+            self._binary = True
+
+        # Otherwise, calculate the new states of the cells from the
+        # probabilities of their numbers of alive neighbors.
+        else:
+            updated_states = self.update_probabilistic_states(self.states)
+            self._binary = None
 
         # Update the grid with new states of cells
-        for i, row in enumerate(self.grid):
-            for j, cell in enumerate(row):
-                cell.state = updated_states[i][j]
+        self.states = updated_states
+
+        # Check if the new states repeat those of one of the two previous
+        # time steps, unless the states have been modified in between
+        self._modified = False
+        self.stable = (np.array_equal(self.states, self.previous_states)
+                       or (self._older_states is not None
+                           and np.array_equal(self.states, self._older_states)))
 
         # Increase time step by one
         self.time_step += 1
 
+    def update_packed_states(self,
+                             states: np.ndarray):
+        """
+        Compute the next generation of a small or large binary grid, under
+        rules that either always or never apply, by packing its cells into
+        bits.
+
+        For small grids, each row of the grid is packed into one byte, so that
+        grids of up to `MAX_PACKED_SIZE` cells per side fit in a 64-bit word,
+        which is then updated by `step_bits` without allocating any
+        intermediate array. For large grids, each row is packed into 64-bit
+        words by `pack_rows`, which are then updated 64 cells at a time by
+        `step_packed_rows`.
+
+        Parameters
+        ----------
+        states: np.ndarray
+            A 2D numpy array with the binary states of the cells, in hundredths.
+
+        Returns
+        -------
+        new_states: np.ndarray
+            A 2D numpy array with the binary states of the cells at the next
+            generation, in hundredths.
+        """
+
+        if self.grid_size <= MAX_PACKED_SIZE:
+            # Pack every row of live cells into one byte, and the bytes of all
+            # rows into one integer
+            row_bytes = np.packbits(states != 0, axis=1, bitorder="little")
+            bits = int.from_bytes(row_bytes.tobytes(), "little")
+
+            # Compute the next generation of the packed grid
+            new_bits = step_bits(bits, self.grid_size, *self._packed_rules)
+
+            # Unpack the rows of live cells from the bytes of the integer
+            new_bytes = np.frombuffer(new_bits.to_bytes(self.grid_size, "little"), dtype=np.uint8)
+            alive = np.unpackbits(new_bytes[:, None], axis=1, count=self.grid_size, bitorder="little")
+
+        else:
+            # Pack the rows of live cells into words, compute the next
+            # generation of the packed rows, and unpack them
+            words = step_packed_rows(pack_rows(states != 0), self.grid_size, *self._packed_rules)
+            alive = unpack_rows(words, self.grid_size)
+
+        return alive * np.uint8(self.STATE_SCALE)
+
+    def update_probabilistic_states(self,
+                                    states: np.ndarray):
+        """
+        Compute the next generation of a grid whose cells are alive with a
+        probability in the range [0, 1].
+
+        This is the vectorized counterpart of `Cell.update_state`, applied to
+        all cells of the grid at once. The probabilities of having exactly n
+        alive neighbors (0 to 8 inclusive) are computed for every cell from
+        the Poisson binomial distribution of its neighbors' states. The new
+        state of a cell is then the sum over n of these probabilities, each
+        weighted by the survival and birth terms of the rules for n neighbors.
+
+        Only the numbers of neighbors for which some rule is defined take part
+        in the sum, and the distribution of the neighbor counts is computed up
+        to the largest of them. For the original rules of the Game of Life this
+        needs 4 out of the 9 probabilities.
+
+        Parameters
+        ----------
+        states: np.ndarray
+            A 2D numpy array with the states of the cells, in hundredths.
+
+        Returns
+        -------
+        new_states: np.ndarray
+            A 2D numpy array with the states of the cells at the next
+            generation, rounded to hundredths.
+        """
+
+        # Convert the states of the cells and their neighbors to probabilities
+        probs = states / self.STATE_SCALE
+        neighbor_probs = self.get_neighbor_states(states) / self.STATE_SCALE
+
+        # Without any applicable rule, every cell dies
+        counts = self._rule_counts
+        if counts.size == 0:
+            return np.zeros_like(states)
+
+        # Calculate the probabilities of exactly n neighbors being alive for
+        # the numbers of neighbors with rules, stacked along the first axis
+        Nt = poisson_binomial(neighbor_probs, max_count=counts[-1])[counts]
+
+        # Add the survival and birth terms of these numbers of neighbors
+        s_probs = self.s_probs[counts, None, None]
+        b_probs = self.b_probs[counts, None, None]
+        new_states = (Nt * (s_probs * probs + b_probs * (1 - probs))).sum(axis=0)
+
+        # Round the new states to hundredths
+        return (new_states * self.STATE_SCALE + 0.5).astype(np.uint8)
+
+    def view_grid(self,
+                  name: str):
+        """
+        Create a view of Cell objects of an array of states of the game.
+
+        Parameters
+        ----------
+        name: str
+            The name of the attribute that holds the states, such as "states",
+            "initial_states" or "previous_states".
+
+        Returns
+        -------
+        grid: GridView | None
+            The view of the states, or None if there are no such states.
+        """
+
+        if getattr(self, name) is None:
+            return None
+
+        return GridView(self, name)
+
     def visualize_grid(self):
         """
         Visualize the grid for observing the game state.
@@ -498,9 +1480,14 @@ class GameOfLife:
         """
 
         if self.variant == "original":
-            print('\n'.join(' '.join(str(int(cell.state)) for cell in row)
-                            for row in self.grid))
+            # Represent live cells by 1 and any other cells by 0
+            labels = np.where(self.states == self.STATE_SCALE, "1", "0")
         else:
-            print('\n'.join(' '.join(str(cell.state) for cell in row)
-                            for row in self.grid))
+            # Look up the labels of all cells from the labels of the
+            # quantized states
+            state_labels = np.array([str(level / self.STATE_SCALE)
+                                     for level in range(self.STATE_SCALE + 1)])
+            labels = state_labels[self.states]
+
+        print('\n'.join(' '.join(row) for row in labels))
         print("\n")
@@ -14,15 +14,44 @@ time modifications to individual cells, granting greater flexibility and control
 during the simulation.
 """
 
-import copy
+import contextlib
+import functools
 import re
+import threading
+import time
 import tkinter as tk
 
 from tkinter import messagebox
 
+import numpy as np
+
 from life.modules.game import GameOfLife
 from life.modules.rule import Rule
 
+# The regular expression of a valid rule entered by the user
+RULE_REGEX = re.compile(r"^[Pp][SsBb]\(\d\)=\d(\.\d+)?$")
+
+# The regular expressions of the partial inputs of the grid parameter entries,
+# by the type of their values
+ENTRY_REGEXES = {
+    "int": re.compile(r"\d*"),
+    "float": re.compile(r"\d*\.?\d*"),
+}
+
+
+def batched(method):
+    """
+    Decorate a method of LifeGUI, so that all the changes it makes to the
+    widgets are applied in a single redraw, as done by `batch_updates`.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.batch_updates():
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
 
 class LifeGUI:
     """
@@ -67,6 +96,12 @@ class LifeGUI:
     STOP_ICON_PATH = 'icons/stop_icon.png'
     PREV_ICON_PATH = 'icons/prev_icon.png'
     NEXT_ICON_PATH = 'icons/next_icon.png'
+    # Loaded icons of the simulation buttons, by name, and the root window
+    # they were loaded for
+    ICONS = None
+    ICONS_ROOT = None
+    # Initial expressions of the rule entries
+    DEFAULT_RULE_EXPRS = ("Ps(2)=1", "Ps(3)=1", "Pb(3)=1", "", "", "", "", "")
     # Labels
     GAME_OF_LIFE = "Game of Life"
     PROBLIFE = "Problife"
@@ -88,6 +123,52 @@ class LifeGUI:
         self.draw_mode = True
         self.time_step = 0
 
+        # The grid and cell sizes of the canvas, once the grid is initialized
+        self.grid_size = None
+        self.cell_size = None
+
+        # The window of the grid, its canvas and the items drawn on it, once
+        # the grid is initialized
+        self.grid_frame = None
+        self.canvas = None
+        self._photo = None
+        self._image_id = None
+        self._text_ids = None
+        self._prev_states = None
+
+        # Synchronize the simulation thread with the GUI. The lock guards the
+        # game against concurrent updates, and the event is set once the last
+        # generation computed by the simulation thread has been drawn.
+        self.life_lock = threading.Lock()
+        self.frame_drawn = threading.Event()
+        self.simulation_thread = None
+        self.delay = 0
+
+        # Number of generations computed by the simulation thread that have
+        # not been drawn yet, guarded by the lock of the game
+        self._pending_ticks = 0
+
+        # Whether an update of the speed of the simulation is scheduled
+        self.speed_update_pending = False
+
+        # The depth of the nested batches of updates to the widgets
+        self._batch_depth = 0
+
+        # Look up tables of the pixels and the labels of the cell states,
+        # indexed by the states in hundredths. The pixels of the Game of Life
+        # are black for live cells and white otherwise, in the grayscale PGM
+        # format (P5), and those of Problife are RGB colors in the PPM format
+        # (P6).
+        levels = range(GameOfLife.STATE_SCALE + 1)
+        colors = [self.state_to_color(level / GameOfLife.STATE_SCALE) for level in levels]
+        gray_lut = np.full(GameOfLife.STATE_SCALE + 1, 255, dtype=np.uint8)
+        gray_lut[GameOfLife.STATE_SCALE] = 0
+        self._pixel_luts = {
+            "original": ("P5", gray_lut),
+            "problife": ("P6", np.array([list(bytes.fromhex(color[1:])) for color in colors], dtype=np.uint8)),
+        }
+        self._label_lut = ["{:.2f}".format(level / GameOfLife.STATE_SCALE) for level in levels]
+
         # Create a frame for the left panel
         left_frame = tk.Frame(self.root)
         left_frame.pack(side=tk.LEFT, padx=10, pady=10)
@@ -110,6 +191,9 @@ class LifeGUI:
         # Create a Status Bar Label at the bottom of the panel
         self.create_status_label(left_frame)
 
+        # Draw every generation computed by the simulation thread
+        self.root.bind("<<Tick>>", self.animate)
+
         # Keep the window alive
         self.root.mainloop()
 
@@ -132,26 +216,9 @@ class LifeGUI:
 
         # Set initial values for rules parameters
         self.rule_type_var = tk.StringVar(value="original")
-        self.rule1_var = tk.StringVar(value="Ps(2)=1")
-        self.rule2_var = tk.StringVar(value="Ps(3)=1")
-        self.rule3_var = tk.StringVar(value="Pb(3)=1")
-        self.rule4_var = tk.StringVar()
-        self.rule5_var = tk.StringVar()
-        self.rule6_var = tk.StringVar()
-        self.rule7_var = tk.StringVar()
-        self.rule8_var = tk.StringVar()
 
         # Make a container for every rule variable
-        self.rule_variables = [
-            self.rule1_var,
-            self.rule2_var,
-            self.rule3_var,
-            self.rule4_var,
-            self.rule5_var,
-            self.rule6_var,
-            self.rule7_var,
-            self.rule8_var,
-        ]
+        self.rule_variables = [tk.StringVar(value=expr) for expr in LifeGUI.DEFAULT_RULE_EXPRS]
 
         # Set initial value for the speed of the simulation
         self.speed_entry_var = tk.IntVar(value=1)
@@ -255,16 +322,38 @@ class LifeGUI:
 
         return True
 
+    def validate_keystroke(self, proposed, entry_type):
+        """
+        Validates a keystroke in a grid parameter entry, before it is applied.
+
+        Keystrokes that would make the text of the entry impossible to parse
+        as a non-negative number are rejected. Partial values, such as an
+        empty entry, are accepted while typing, and their ranges are checked
+        when the grid is initialized.
+
+        Parameters
+        ----------
+        proposed: str
+            The text of the entry if the keystroke is applied.
+
+        entry_type: str
+            The type of the value of the entry ('int' or 'float').
+
+        Returns
+        -------
+        bool
+            True if the keystroke is accepted, False otherwise.
+        """
+
+        return ENTRY_REGEXES[entry_type].fullmatch(proposed) is not None
+
     def validate_rule(self, expr):
         """
         Validates a custom rule entered by the user.
         """
 
-        # Use a regular expression to validate the rule
-        rule_regex = r"^[Pp][SsBb]\(\d\)=\d(\.\d+)?$"
-
         # If the rule matches the regular expression, it's valid
-        if re.fullmatch(rule_regex, expr):
+        if RULE_REGEX.fullmatch(expr):
             condition = expr[1].lower()
             neighbor_count = int(expr[3])
             probability = float(expr[6:])
@@ -338,11 +427,15 @@ class LifeGUI:
             self.seed_var
         ]
 
+        # The types of the values of the entries, whose keystrokes are validated
+        entry_types = ["int", "int", "float", "int"]
+        validate_command = self.root.register(self.validate_keystroke)
+
         # Initialize a container for the grid parameter entry boxes
         self.grid_parameters_entries = {}
 
         # Create and add labels and corresponding entries
-        for i, (label_text, entry_var) in enumerate(zip(labels, entries)):
+        for i, (label_text, entry_var, entry_type) in enumerate(zip(labels, entries, entry_types)):
 
             if label_text == "Seed":
                 button = tk.Checkbutton(self.grid_parameters_frame)
@@ -363,7 +456,9 @@ class LifeGUI:
             entry.config(font=self.label_font,
                          textvariable=entry_var,
                          width=10,
-                         justify="center")
+                         justify="center",
+                         validate="key",
+                         validatecommand=(validate_command, "%P", entry_type))
             entry.grid(row=i, column=1, padx=5, pady=5)
 
             if label_text == "Seed":
@@ -454,7 +549,7 @@ class LifeGUI:
                                       sticky='w', padx=5, pady=5)
 
         # Create and add rule entries
-        rule_labels = [f"Rule {j + 1}" for j in range(8)]
+        rule_labels = [f"Rule {j + 1}" for j in range(len(self.rule_variables))]
         for i, (rule_text, rule_var) in enumerate(zip(rule_labels, self.rule_variables), start=2):
             label = tk.Label(self.rules_frame,
                              font=self.label_font,
@@ -510,27 +605,24 @@ class LifeGUI:
                                      sliderrelief='raised')
         self.speed_slider.pack(fill="x")
 
-        # Load icons for buttons
-        play_icon = tk.PhotoImage(file=LifeGUI.PLAY_ICON_PATH)
-        stop_icon = tk.PhotoImage(file=LifeGUI.STOP_ICON_PATH)
-        prev_icon = tk.PhotoImage(file=LifeGUI.PREV_ICON_PATH)
-        next_icon = tk.PhotoImage(file=LifeGUI.NEXT_ICON_PATH)
+        # Retrieve the icons for buttons
+        icons = self.load_icons(self.root)
 
         # Create and add Start, Stop, Next, and Previous buttons
         self.start_button = self.create_image_button(self.sim_parameters_frame,
-                                                     play_icon,
+                                                     icons["play"],
                                                      self.start_animation,
                                                      tk.DISABLED)
         self.stop_button = self.create_image_button(self.sim_parameters_frame,
-                                                    stop_icon,
+                                                    icons["stop"],
                                                     self.stop_animation,
                                                     tk.DISABLED)
         self.prev_step_button = self.create_image_button(self.sim_parameters_frame,
-                                                         prev_icon,
+                                                         icons["prev"],
                                                          self.prev_step,
                                                          tk.DISABLED)
         self.next_step_button = self.create_image_button(self.sim_parameters_frame,
-                                                         next_icon,
+                                                         icons["next"],
                                                          self.next_step,
                                                          tk.DISABLED)
 
@@ -554,8 +646,8 @@ class LifeGUI:
         canvas object that will represent the grid of the Game of Life simulation.
         """
 
-        grid_size = int(self.grid_size_var.get())
-        cell_size = int(self.cell_size_var.get())
+        grid_size = self.grid_size
+        cell_size = self.cell_size
 
         # Create a new window for the grid canvas
         self.grid_frame = tk.Toplevel(self.root)
@@ -572,6 +664,16 @@ class LifeGUI:
         self.canvas.pack(fill="both", expand=True)
         self.canvas.bind("<Button-1>", self.handle_mouse_click)
 
+        # Keep a reference to the image of the grid drawn on the canvas,
+        # since tkinter does not keep one
+        self._photo = None
+
+        # Canvas items of the image of the grid and of the state labels, if
+        # they have been created, and the states of the cells they show
+        self._image_id = None
+        self._text_ids = None
+        self._prev_states = None
+
     # BELOW WE DEFINE METHODS FOR INITIALIZING THE GRID
 
     def initialize_grid(self):
@@ -584,18 +686,24 @@ class LifeGUI:
         if not self.validate_grid_prmts_entries():
             return
 
-        # Destroy the existing grid window if there is one
-        if hasattr(self, 'grid_frame') and self.grid_frame is not None:
-            self.grid_frame.destroy()
+        # Destroy the existing grid window if there is one, after stopping
+        # its animation, which may still draw on its canvas
+        if self.grid_frame is not None:
             if self.animation_running:
                 self.stop_animation()
+            self.grid_frame.destroy()
+
+        # Retrieve the grid and cell sizes from GUI, and keep them, so that
+        # they are not read again at every drawing
+        grid_size = int(self.grid_size_var.get())
+        cell_size = int(self.cell_size_var.get())
+        self.grid_size = grid_size
+        self.cell_size = cell_size
 
         # Create a Canvas object to
         self.create_grid_frame()
 
         # Retrieve user inputs from GUI
-        grid_size = int(self.grid_size_var.get())
-        cell_size = int(self.cell_size_var.get())
         alive_percentage = float(self.alive_percentage_var.get())
 
         # Get the seed if the user defined it
@@ -614,10 +722,18 @@ class LifeGUI:
 
         # Initialize the game of life with given parameters
         variant = self.variants_var.get()
-        self.life = GameOfLife(variant=variant)
-        self.life.initialize_grid(grid_size=grid_size,
-                                  alive_percentage=alive_percentage,
-                                  seed=seed)
+        life = GameOfLife(variant=variant)
+        life.initialize_grid(grid_size=grid_size,
+                             alive_percentage=alive_percentage,
+                             seed=seed)
+
+        # Replace the game, stopping the animation of the previous one and
+        # discarding its generations that have not been drawn
+        with self.life_lock:
+            self.animation_running = False
+            self.life = life
+            self._pending_ticks = 0
+        self.frame_drawn.set()
 
         # Configure the canvas size based on the grid and cell sizes
         self.canvas.config(width=grid_size * cell_size,
@@ -638,75 +754,110 @@ class LifeGUI:
         # Update the status label to indicate that the grid has been initialized
         self.update_status("Step 2. Initialize Rules")
 
+    @batched
     def draw_grid(self):
         """
         Draw the grid on the canvas. This method handles the animation for both
         the original Game of Life and the Problife simulation.
 
         In the case of the original Game of Life, cells are drawn as either black
-        or white squares to represent alive and dead cells, respectively.
+        or white squares to represent alive and dead cells, respectively. The
+        whole grid is drawn as a single image, built from the array of states.
         In the Problife simulation, the state of each cell is a real number in the
         range [0, 1], and the color of the cell goes from blue (representing 0) to
         green (representing 0.5) to red (representing 1) as the state of the cell
-        increases.
+        increases. The cells are drawn as a single color image, built from the
+        array of states through a lookup table of the colors, under the grid
+        lines, and only the state labels of the cells whose state has changed
+        since the last drawing are then updated.
         """
 
-        # Retrieve grid size from GUI inputs and convert it to an integer
-        grid_size = int(self.grid_size_var.get())
+        # Retrieve the grid and cell sizes of the canvas
+        grid_size = self.grid_size
+        cell_size = self.cell_size
 
-        # Retrieve cell size from GUI inputs and convert it to an integer
-        cell_size = int(self.cell_size_var.get())
+        states = self.life.states
 
-        # Clear any existing grid on the canvas
-        self.canvas.delete("all")
+        # If no cell has changed since the grid was last drawn, such as for
+        # a still life, there is nothing to redraw
+        if self._image_id is not None and np.array_equal(states, self._prev_states):
+            return
 
-        # Handle the simulation of Game of Life
-        if self.variants_var.get() == "original":
-            # Iterate through each cell in the grid
-            for i in range(grid_size):
-                for j in range(grid_size):
-                    # If the cell is alive (state == 1), draw a black rectangle at its location on the canvas
-                    if self.life.grid[i, j].state == 1:
-                        self.canvas.create_rectangle(j * cell_size,
-                                                     i * cell_size,
-                                                     (j + 1) * cell_size,
-                                                     (i + 1) * cell_size,
-                                                     fill="black")
-
-        # Handle the simulation of Problife
+        # Build an image with one pixel per cell, looked up from the state of
+        # the cell in the pixel table of the variant
+        magic, pixel_lut = self._pixel_luts[self.life.variant]
+        pixels = pixel_lut[states]
+        header = f"{magic}\n{grid_size} {grid_size}\n255\n".encode()
+
+        # Scale every pixel up to a cell
+        image = tk.PhotoImage(data=header + pixels.tobytes())
+        self._photo = image.zoom(cell_size)
+
+        # Create the image item of the grid once, with the grid lines and the
+        # state labels of Problife on top of it, and mark every cell as
+        # changed. Afterwards, only the image of the item is replaced.
+        if self._image_id is None:
+            self.canvas.delete("all")
+            self._image_id = self.canvas.create_image(0, 0, anchor=tk.NW, image=self._photo)
+            self._text_ids = None
+            if self.life.variant != "original":
+                for k in range(grid_size + 1):
+                    self.canvas.create_line(0, k * cell_size, grid_size * cell_size, k * cell_size)
+                    self.canvas.create_line(k * cell_size, 0, k * cell_size, grid_size * cell_size)
+                if cell_size >= 40:
+                    self._text_ids = np.empty((grid_size, grid_size), dtype=object)
+            self._prev_states = np.full((grid_size, grid_size), -1, dtype=np.int16)
         else:
-            # Iterate through each cell in the grid
-            for i in range(grid_size):
-                for j in range(grid_size):
-                    # Determine the cell color based on its state (blue at 0, green at 0.5, red at 1)
-                    cell_state = self.life.grid[i, j].state
-                    if cell_state == 0:
-                        r, g, b, = 255, 255, 255
-                    elif 0 < cell_state < 0.5:
-                        # Interpolate from blue to green
-                        r = 0
-                        g = int(cell_state * 2 * 255)
-                        b = int((1 - 2 * cell_state) * 255)
-                    else:
-                        # Interpolate from green to red
-                        r = int((cell_state - 0.5) * 2 * 255)
-                        g = int((1 - 2 * (cell_state - 0.5)) * 255)
-                        b = 0
-
-                    cell_color = "#%02x%02x%02x" % (r, g, b)  # Generate RGB color string
-
-                    # Draw the cell with its color on the canvas
-                    self.canvas.create_rectangle(j * cell_size,
-                                                 i * cell_size,
-                                                 (j + 1) * cell_size,
-                                                 (i + 1) * cell_size,
-                                                 fill=cell_color)
-
-                    # Display the state of the cell
-                    if int(self.cell_size_var.get()) >= 40:
-                        self.canvas.create_text((j + 0.5) * cell_size,
-                                                (i + 0.5) * cell_size,
-                                                text="{:.2f}".format(cell_state))
+            self.canvas.itemconfig(self._image_id, image=self._photo)
+
+        # Display the states of the Problife cells whose state has changed
+        # since the grid was last drawn. The state label of every cell is
+        # created the first time the grid is drawn, and only updated later.
+        if self._text_ids is not None:
+            for i, j in np.argwhere(states != self._prev_states):
+                level = states[i, j]
+                if self._text_ids[i, j] is not None:
+                    self.canvas.itemconfig(self._text_ids[i, j], text=self._label_lut[level])
+                else:
+                    self._text_ids[i, j] = self.canvas.create_text((j + 0.5) * cell_size,
+                                                                   (i + 0.5) * cell_size,
+                                                                   text=self._label_lut[level])
+
+        # Remember the states that are now drawn
+        self._prev_states = states.astype(np.int16)
+
+    @staticmethod
+    def state_to_color(cell_state):
+        """
+        Determine the color of a Problife cell based on its state, going from
+        blue at 0 to green at 0.5 and red at 1, while dead cells are white.
+
+        Parameters
+        ----------
+        cell_state: float
+            The state of the cell, in the range [0, 1].
+
+        Returns
+        -------
+        cell_color: str
+            The RGB color string of the cell.
+        """
+
+        if cell_state == 0:
+            r, g, b, = 255, 255, 255
+        elif 0 < cell_state < 0.5:
+            # Interpolate from blue to green
+            r = 0
+            g = int(cell_state * 2 * 255)
+            b = int((1 - 2 * cell_state) * 255)
+        else:
+            # Interpolate from green to red
+            r = int((cell_state - 0.5) * 2 * 255)
+            g = int((1 - 2 * (cell_state - 0.5)) * 255)
+            b = 0
+
+        cell_color = "#%02x%02x%02x" % (r, g, b)  # Generate RGB color string
+        return cell_color
 
     def clean_grid(self):
         """
@@ -714,10 +865,12 @@ class LifeGUI:
         """
 
         # Reset the grid in the GameOfLife object
-        self.life.reset_grid()
+        with self.life_lock:
+            self.life.reset_grid()
 
         # Clear the grid from the canvas
         self.canvas.delete("all")
+        self._image_id = None
 
         # Enable the Reset button to return the grid to its initial state
         self.reset_button.config(state=tk.NORMAL)
@@ -744,11 +897,11 @@ class LifeGUI:
         Reset the simulation grid to its initial state.
         """
 
-        # Reset the grid in the GameOfLife object to the initial state
-        self.life.grid = copy.deepcopy(self.life.initial_grid)
-
-        # Draw the initial state of the grid on the canvas
-        self.draw_grid()
+        # Reset the grid in the GameOfLife object to the initial state, and
+        # draw it on the canvas
+        with self.life_lock:
+            self.life.restore_initial()
+            self.draw_grid()
 
         # Disable the Reset button as the grid is already in its initial state
         self.reset_button.config(state=tk.DISABLED)
@@ -793,20 +946,17 @@ class LifeGUI:
 
     # BELOW WE DEFINE METHODS FOR SETTING THE RULES OF THE SIMULATION
 
+    @batched
     def set_default_rules(self):
         """
         Reset the game rules to their default state.
         """
 
-        # Clear existing game rules
-        Rule.clear_rules()
-
         # Retrieve the type of rules from the GUI
         rule_type = self.rule_type_var.get()
 
-        # Clear all the rule fields
-        for variable in self.rule_variables:
-            variable.set(value="")
+        # Clear existing game rules
+        Rule.clear_rules()
 
         # For original rule type, get the original rules
         if rule_type == "original":
@@ -823,9 +973,10 @@ class LifeGUI:
         # Convert the rules into expressions
         rules_to_expr = [rule.rule_to_expr() for rule in Rule.rules.values()]
 
-        # Set the expressions in the GUI
-        for j, rule in enumerate(rules_to_expr):
-            self.rule_variables[j].set(rule)
+        # Set the expressions in the GUI, and clear the remaining rule fields
+        rules_to_expr += [""] * (len(self.rule_variables) - len(rules_to_expr))
+        for variable, rule in zip(self.rule_variables, rules_to_expr):
+            variable.set(rule)
 
     def set_rules(self):
         """
@@ -857,35 +1008,95 @@ class LifeGUI:
 
     # BELOW WE DEFINE METHODS FOR ANIMATING THE SIMULATION
 
-    def animate(self):
+    @batched
+    def animate(self, event=None):
         """
         Perform the animation of the Game of Life.
 
-        This method is responsible for updating the grid at each time step and
-        drawing it on the canvas. It's a recursive method which schedules itself
-        to run again after a small delay, creating the animation effect.
-        """
+        This method is called on the GUI thread whenever the simulation thread
+        has computed a new generation of the grid. It draws the grid on the
+        canvas, and then lets the simulation thread compute the next one.
+        Ticks whose generations have already been accounted for, when the
+        animation was stopped or the grid was replaced, are ignored.
 
-        # If the animation is currently running, perform the next step of the animation
-        if self.animation_running:
-            # Update the grid to the next time step
-            self.life.update_grid()
+        Parameters
+        ----------
+        event: Event, default=None
+            The virtual event generated by the simulation thread.
+        """
 
-            # Draw the updated grid on the canvas
+        # Draw the updated grid on the canvas, and count its new generations
+        with self.life_lock:
+            if not self._pending_ticks:
+                return
+            self.time_step += self._pending_ticks
+            self._pending_ticks = 0
             self.draw_grid()
 
-            # Update the status label with a message and the current time step
-            self.time_step += 1
+        # Update the status label with a message and the current time step
+        if self.animation_running:
             self.update_status(f"Animation Started\n"
                                f"Current Generation: {self.time_step}")
 
-            # Schedule the next call to animate.
-            # The after method is a way to schedule something to happen after
-            # a certain amount of time. Here, we're scheduling `self.animate()`
-            # to be called again after 100ms, creating a cycle, until
-            # `self.animation_running` is set to `False`.
-            self.root.after(int(self.speed_entry_var.get()), self.animate)
+        # Stop the animation once the grid settles into a still life or a
+        # period 2 oscillator, since the next frames would only repeat it
+        if self.animation_running and self.life.stable:
+            self.stop_animation()
+            self.update_status(f"Stable state reached\n"
+                               f"Current Generation: {self.time_step}")
+
+        # Let the simulation thread compute the next generation
+        self.frame_drawn.set()
+
+    def run_simulation(self):
+        """
+        Compute the generations of the Game of Life on a background thread.
+
+        Computing the grid on its own thread keeps the GUI responsive and
+        pipelines the computation of a generation with the drawing of the
+        previous one. After each generation, the thread notifies the GUI with
+        a `<<Tick>>` virtual event and waits until the grid has been drawn,
+        so that it never gets ahead of the display. The generations are paced
+        against a monotonic clock, with one deadline per generation, so that
+        the time spent computing and drawing them does not add to the delay.
+        It stops as soon as `self.animation_running` is set to `False`, which
+        is checked under the lock of the game, so that no generation is
+        computed once the animation has been stopped.
+        """
+
+        deadline = time.monotonic()
+        while True:
+            # Wait until the previous generation has been drawn
+            self.frame_drawn.wait()
+            self.frame_drawn.clear()
+            if not self.animation_running:
+                return
+
+            # Update the grid to the next time step, unless the animation
+            # has been stopped in the meantime
+            with self.life_lock:
+                if not self.animation_running:
+                    return
+                self.life.update_grid()
+                self._pending_ticks += 1
+
+            # Notify the GUI thread that a new generation is ready
+            try:
+                self.root.event_generate("<<Tick>>", when="tail")
+            except tk.TclError:
+                # The window has been closed
+                return
+
+            # Wait until the deadline of the next generation. When running
+            # late, start again from now rather than rushing to catch up.
+            deadline += self.delay
+            now = time.monotonic()
+            if deadline > now:
+                time.sleep(deadline - now)
+            else:
+                deadline = now
 
+    @batched
     def start_animation(self):
         """
         Start the animation of the Game of Life.
@@ -893,7 +1104,14 @@ class LifeGUI:
 
         if not self.animation_running:
             self.animation_running = True
-            self.animate()
+
+            # Start computing the generations on a background thread, unless
+            # the thread of a previous animation has not stopped yet
+            self.delay = int(self.speed_entry_var.get()) / 1000
+            self.frame_drawn.set()
+            if self.simulation_thread is None or not self.simulation_thread.is_alive():
+                self.simulation_thread = threading.Thread(target=self.run_simulation, daemon=True)
+                self.simulation_thread.start()
 
             for key, entry in self.grid_parameters_entries.items():
                 entry.config(state=tk.DISABLED)
@@ -907,12 +1125,23 @@ class LifeGUI:
             self.next_step_button.config(state=tk.DISABLED)
             self.prev_step_button.config(state=tk.DISABLED)
 
+    @batched
     def stop_animation(self):
         """
         Pause the animation of the Game of Life.
         """
 
-        self.animation_running = False
+        # Stop the simulation thread from computing any further generation,
+        # and draw the generations it has computed but not drawn yet
+        with self.life_lock:
+            self.animation_running = False
+            if self._pending_ticks:
+                self.time_step += self._pending_ticks
+                self._pending_ticks = 0
+                self.draw_grid()
+
+        # Wake up the simulation thread, so that it stops
+        self.frame_drawn.set()
 
         for key, entry in self.grid_parameters_entries.items():
             if key != "Seed":
@@ -924,7 +1153,8 @@ class LifeGUI:
         self.start_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
         self.next_step_button.config(state=tk.NORMAL)
-        self.prev_step_button.config(state=tk.NORMAL)
+        if self.life.history:
+            self.prev_step_button.config(state=tk.NORMAL)
 
         #
         self.update_status(f"Animation Paused\n"
@@ -935,8 +1165,9 @@ class LifeGUI:
 
         # If the simulation isn't running, update the grid once and redraw it
         if not self.animation_running:
-            self.life.update_grid()
-            self.draw_grid()
+            with self.life_lock:
+                self.life.update_grid()
+                self.draw_grid()
             self.time_step += 1
             self.update_status(f"Step Forward\n"
                                f"Current Generation: {self.time_step}")
@@ -944,34 +1175,105 @@ class LifeGUI:
         self.cleanup_button.config(state=tk.NORMAL)
         self.reset_button.config(state=tk.NORMAL)
 
-        if self.time_step >= 1:
+        if self.life.history:
             self.prev_step_button.config(state=tk.NORMAL)
 
     def prev_step(self):
-        """Advances the simulation by a single step."""
+        """Moves the simulation back by a single step."""
 
-        # If the simulation isn't running, update the grid once and redraw it
-        if not self.animation_running and self.time_step > 0:
-            self.life.step_backwards()
-            self.draw_grid()
+        # If the simulation isn't running, restore the previous grid and redraw it
+        if not self.animation_running and self.life.history:
+            with self.life_lock:
+                self.life.step_backwards()
+                self.draw_grid()
             self.time_step -= 1
             self.update_status(f"Step Backwards\n"
                                f"Current Generation: {self.time_step}")
 
+        # Disable the Previous Step button when no previous grid is left
+        if not self.life.history:
             self.prev_step_button.config(state=tk.DISABLED)
 
         self.cleanup_button.config(state=tk.NORMAL)
         self.reset_button.config(state=tk.NORMAL)
 
     def update_speed(self, value):
+        """
+        Schedule an update of the speed of the simulation when the slider moves.
+
+        The slider calls this method for every step of a drag, so the updates
+        are coalesced into a single call to `apply_speed` once Tk is idle.
+        """
+
+        if self.speed_update_pending:
+            return
+        self.speed_update_pending = True
+        self.root.after_idle(self.apply_speed)
+
+    def apply_speed(self):
         """Update the speed of the simulation based on slider value."""
 
-        #
-        speed = int(value)
+        # Read the current value of the slider, which may have moved since
+        # the update was scheduled
+        self.speed_update_pending = False
+        speed = int(self.speed_slider.get())
         self.speed_entry_var.set(speed)
 
+        # Keep the delay between generations for the simulation thread,
+        # which cannot access the tk variables
+        self.delay = speed / 1000
+
     # BELOW WE DEFINE UTILITY METHODS FOR THE GUI
 
+    @contextlib.contextmanager
+    def batch_updates(self):
+        """
+        Batch the changes made to the widgets within the context, so that they
+        are applied in a single redraw.
+
+        The batches can be nested, in which case the widgets are redrawn once,
+        when the outermost batch ends.
+        """
+
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                # Process the pending redraws of all the changes at once
+                self.root.update_idletasks()
+
+    @classmethod
+    def load_icons(cls, root):
+        """
+        Load the icons of the simulation buttons, once per root window.
+
+        The icons are kept at the class level, which also keeps references to
+        them, so that tkinter does not garbage collect the images while they
+        are displayed.
+
+        Parameters
+        ----------
+        root: tk.Tk
+            The root window for the tkinter GUI.
+
+        Returns
+        -------
+        icons: dict
+            A dictionary mapping the names of the icons to their images.
+        """
+
+        if cls.ICONS is None or cls.ICONS_ROOT is not root:
+            cls.ICONS = {name: tk.PhotoImage(master=root, file=path)
+                         for name, path in [("play", cls.PLAY_ICON_PATH),
+                                            ("stop", cls.STOP_ICON_PATH),
+                                            ("prev", cls.PREV_ICON_PATH),
+                                            ("next", cls.NEXT_ICON_PATH)]}
+            cls.ICONS_ROOT = root
+
+        return cls.ICONS
+
     def create_checkbutton(self, parent, text, variable, onvalue):
         """Helper function to create a checkbutton."""
         button = tk.Checkbutton(parent)
@@ -1004,38 +1306,19 @@ class LifeGUI:
             The mouse click event object.
         """
 
-        cell_size = int(self.cell_size_var.get())
+        cell_size = self.cell_size
         if self.draw_mode:
 
             col = event.x // cell_size
             row = event.y // cell_size
 
             if 0 <= col < self.life.grid_size and 0 <= row < self.life.grid_size:
-                # Toggle the state of the cell
-                self.life.grid[row, col].state = 1 - self.life.grid[row, col].state
-
-                # Check the type of simulation
-                if self.variants_var.get() == "original":
-                    color = "black"
-                    if self.life.grid[row, col].state == 0:
-                        color = "white"
-                else:
-                    color = "red"
-                    if self.life.grid[row, col].state == 0:
-                        color = "white"
-
-                # Draw the rectangle
-                self.canvas.create_rectangle(col * cell_size,
-                                             row * cell_size,
-                                             (col + 1) * cell_size,
-                                             (row + 1) * cell_size,
-                                             fill=color)
-
-                # If the cell size is large enough, draw the state's probability
-                if cell_size >= 40 and self.life.grid[row, col].state != 0:
-                    self.canvas.create_text((col + 0.5) * cell_size,
-                                            (row + 0.5) * cell_size,
-                                            text="{:.2f}".format(self.life.grid[row, col].state))
+                with self.life_lock:
+                    # Toggle the state of the cell
+                    self.life.toggle_cell(row, col)
+
+                    # Redraw the cells whose state has changed
+                    self.draw_grid()
 
     def toggle_entry(self):
         """
@@ -10,6 +10,11 @@ cells and an associated probability of transition under those conditions.
 
 import re
 
+import numpy as np
+
+# The regular expression of a rule expression of the form 'Pc(N)=x'
+RULE_EXPR_REGEX = re.compile(r"P([sb])\((\d+)\)=(\d+(?:\.\d+)?)")
+
 
 class Rule:
     """
@@ -41,6 +46,15 @@ class Rule:
     # Counts the number of rules inside the rules dictionary
     n_rules = 0
 
+    # Maps the condition and the number of neighbors of every rule to its key
+    # in the rules dictionary
+    rule_keys = {}
+
+    # Hold the survival and birth probabilities of the rules, indexed by the
+    # number of neighbors, for the rules of at most 8 neighbors
+    survival_probs = np.zeros(9)
+    birth_probs = np.zeros(9)
+
     def __init__(self,
                  condition: str,
                  n_neighbors: int,
@@ -56,12 +70,14 @@ class Rule:
             raise ValueError("Probability must be a float between 0 and 1")
 
         # Check if a similar rule already exists
-        for rule in Rule.rules.values():
-            if rule.condition == condition and rule.n_neighbors == n_neighbors:
-                if rule.probability != probability:
-                    print(f"Updated rule P{condition}({n_neighbors}) from {rule.probability} to {probability}")
-                    rule.probability = probability
-                return
+        key = Rule.rule_keys.get((condition, n_neighbors))
+        if key is not None:
+            rule = Rule.rules[key]
+            if rule.probability != probability:
+                print(f"Updated rule P{condition}({n_neighbors}) from {rule.probability} to {probability}")
+                rule.probability = probability
+                Rule._tabulate(condition, n_neighbors, probability)
+            return
 
         # Assign the validated parameters to instance variables
         self.condition = condition
@@ -69,6 +85,8 @@ class Rule:
         self.probability = probability
         # Store the instance in the 'rules' dictionary
         Rule.rules[Rule.n_rules] = self
+        Rule.rule_keys[(condition, n_neighbors)] = Rule.n_rules
+        Rule._tabulate(condition, n_neighbors, probability)
         # Increment the rule count
         Rule.n_rules += 1
 
@@ -88,6 +106,35 @@ class Rule:
         rule_expr = f"P{self.condition}({self.n_neighbors})={self.probability}"
         return rule_expr
 
+    @classmethod
+    def _tabulate(cls,
+                  condition: str,
+                  n_neighbors: int,
+                  probability: float):
+        """
+        Store the probability of a rule in the table of its condition.
+
+        Parameters
+        ----------
+        condition: str
+            The condition of the rule ('s' or 'b').
+
+        n_neighbors: int
+            The number of neighbors of the rule.
+
+        probability: float
+            The probability of the rule, or 0 if the rule is deleted.
+        """
+
+        # Skip the rules that can never apply to a cell with 8 neighbors
+        if n_neighbors > 8:
+            return
+        # Store the probability in the table of the rule's condition
+        if condition == "s":
+            Rule.survival_probs[n_neighbors] = probability
+        if condition == "b":
+            Rule.birth_probs[n_neighbors] = probability
+
     @classmethod
     def clear_rules(cls):
         """
@@ -97,6 +144,9 @@ class Rule:
         # Reset the rules dictionary
         Rule.rules = {}
         Rule.n_rules = 0
+        Rule.rule_keys = {}
+        Rule.survival_probs = np.zeros(9)
+        Rule.birth_probs = np.zeros(9)
 
     @classmethod
     def delete_rule(cls, 
@@ -115,12 +165,13 @@ class Rule:
         """
 
         # Find the key of the rule to delete
-        for key, rule in cls.rules.items():
-            if rule.condition == condition and rule.n_neighbors == n_neighbors:
-                # Delete the rule
-                del cls.rules[key]
-                print(f"Rule P{condition}({n_neighbors}) has been deleted.")
-                return
+        key = cls.rule_keys.pop((condition, n_neighbors), None)
+        if key is not None:
+            # Delete the rule
+            del cls.rules[key]
+            cls._tabulate(condition, n_neighbors, 0)
+            print(f"Rule P{condition}({n_neighbors}) has been deleted.")
+            return
 
         raise ValueError(f"No rule with condition {condition} and {n_neighbors} neighbors found")
 
@@ -160,7 +211,7 @@ class Rule:
         """
 
         # Use regex to match the string expression to the expected format 'Pc(N)=x'
-        match = re.fullmatch(r"P([sb])\((\d+)\)=(\d+(?:\.\d+)?)", expr)
+        match = RULE_EXPR_REGEX.fullmatch(expr)
 
         if match:
             # Extract the condition, number of neighbors, and probability from the matched groups
@@ -228,6 +279,30 @@ class Rule:
 
         return original_rules
 
+    @classmethod
+    def get_probabilities_by_neighbors(cls):
+        """
+        Retrieves the survival and birth probabilities of the defined rules,
+        tabulated by the number of neighbors.
+
+        Returns
+        -------
+        s_probs: np.ndarray
+            An array of length 9, whose n-th element is the probability that
+            a live cell with n live neighbors survives. It is zero if there is
+            no survival rule for n neighbors.
+
+        b_probs: np.ndarray
+            An array of length 9, whose n-th element is the probability that
+            a dead cell with n live neighbors is born. It is zero if there is
+            no birth rule for n neighbors.
+        """
+
+        # Copy the tables that are kept up to date with the rules
+        s_probs, b_probs = cls.survival_probs.copy(), cls.birth_probs.copy()
+
+        return s_probs, b_probs
+
     @classmethod
     def get_problife_rules(cls):
         """
@@ -271,14 +346,10 @@ class Rule:
         # Initialize an empty dictionary to hold the rules by their condition
         rules_by_condition = {"s": [], "b": []}
 
-        # For each possible condition ('s' and 'b')
-        for condition in ["s", "b"]:
-            # Iterate over each rule in the class-level 'rules' dictionary
-            for rule in cls.rules.values():
-                # If the rule's condition matches the current condition being processed
-                if rule.condition == condition:
-                    # Add the rule's number of neighbors to the appropriate list in the dictionary
-                    rules_by_condition[condition].append(rule.n_neighbors)
+        # Iterate over each rule in the class-level 'rules' dictionary
+        for rule in cls.rules.values():
+            # Add the rule's number of neighbors to the list of its condition
+            rules_by_condition[rule.condition].append(rule.n_neighbors)
 
         return rules_by_condition
 
@@ -311,6 +382,30 @@ class Rule:
 
         return rules_by_neighbors
 
+    @classmethod
+    def set_rules(cls,
+                  rules: dict):
+        """
+        Replace all the defined rules with the given rules.
+
+        Parameters
+        ----------
+        rules: dict
+            A dictionary mapping an integer to a Rule object.
+        """
+
+        # Replace the rules dictionary
+        Rule.rules = rules
+        Rule.n_rules = max(rules, default=-1) + 1
+
+        # Index and tabulate the probabilities of the new rules
+        Rule.rule_keys = {}
+        Rule.survival_probs = np.zeros(9)
+        Rule.birth_probs = np.zeros(9)
+        for key, rule in rules.items():
+            Rule.rule_keys[(rule.condition, rule.n_neighbors)] = key
+            Rule._tabulate(rule.condition, rule.n_neighbors, rule.probability)
+
     @classmethod
     def update_rule(cls,
                     condition: str,
@@ -332,10 +427,11 @@ class Rule:
         """
 
         # Check if the rule exists
-        for rule in Rule.rules.values():
-            if rule.condition == condition and rule.n_neighbors == n_neighbors:
-                # Update the probability of the rule
-                rule.probability = probability
-                return
+        key = Rule.rule_keys.get((condition, n_neighbors))
+        if key is not None:
+            # Update the probability of the rule
+            Rule.rules[key].probability = probability
+            Rule._tabulate(condition, n_neighbors, probability)
+            return
         raise ValueError(f"No rule with condition {condition} and "
                          f"{n_neighbors} neighbors found")
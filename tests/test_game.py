@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+
+from life.modules.cell import Cell
+from life.modules.game import GameOfLife
+
+
+class TestGridView(unittest.TestCase):
+
+    def setUp(self):
+        self.game = GameOfLife(variant="problife")
+        self.game.initialize_grid(grid_size=6, alive_percentage=0.5, seed=1)
+
+    def test_cells_read_states(self):
+        for i in range(6):
+            for j in range(6):
+                self.assertEqual(self.game.grid[i][j].state, self.game.states[i, j] / 100)
+                self.assertEqual(self.game.grid[i, j].state, self.game.states[i, j] / 100)
+
+    def test_cells_write_states(self):
+        self.game.grid[2][3].state = 0.42
+        self.game.grid[4, 5].state = 1
+        self.assertEqual(self.game.states[2, 3], 42)
+        self.assertEqual(self.game.states[4, 5], 100)
+        self.assertEqual(self.game.grid[2][3].state, 0.42)
+
+    def test_cells_reject_invalid_states(self):
+        with self.assertRaises(ValueError):
+            self.game.grid[0][0].state = 1.5
+
+    def test_initial_grid_is_a_view_of_initial_states(self):
+        self.game.initial_grid[1][1].state = 0.3
+        self.assertEqual(self.game.initial_states[1, 1], 30)
+        self.assertNotEqual(self.game.states[1, 1], 30)
+
+    def test_previous_grid_follows_updates(self):
+        self.assertIsNone(self.game.previous_grid)
+        self.game.set_rules()
+        states = self.game.states.copy()
+        self.game.update_grid()
+        np.testing.assert_array_equal(self.game.grid_to_array(self.game.previous_grid), states / 100)
+
+    def test_assign_grids(self):
+        new_states = np.round(np.random.default_rng(0).random((6, 6)), 2)
+
+        self.game.grid = new_states
+        np.testing.assert_array_equal(self.game.grid_to_array(), new_states)
+
+        cells = [[Cell(i, j, 1 - state) for j, state in enumerate(row)]
+                 for i, row in enumerate(new_states)]
+        self.game.grid = cells
+        np.testing.assert_array_equal(self.game.states, np.rint((1 - new_states) * 100))
+
+        self.game.initial_grid = self.game.grid
+        np.testing.assert_array_equal(self.game.initial_states, self.game.states)
+
+        self.game.previous_grid = None
+        self.assertIsNone(self.game.previous_states)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+import numpy as np
+
+from life.modules.game import GameOfLife
+from life.modules.rule import Rule
+
+
+def random_rule_sets(rng, n_sets):
+    """Generate random deterministic rule sets, always including birth on 0."""
+
+    rule_sets = [([0], list(range(9))), ([0, 3], [2, 3]), ([3], [2, 3])]
+    for _ in range(n_sets):
+        births = np.flatnonzero(rng.random(9) < 0.4).tolist()
+        survivals = np.flatnonzero(rng.random(9) < 0.4).tolist()
+        rule_sets.append((births, survivals))
+    return rule_sets
+
+
+def make_game(grid_size, births, survivals, rng):
+    """Create a binary game whose rules are the given births and survivals."""
+
+    Rule.clear_rules()
+    rules = {}
+    for n in births:
+        rules[len(rules)] = Rule("b", n, 1)
+    for n in survivals:
+        rules[len(rules)] = Rule("s", n, 1)
+
+    game = GameOfLife()
+    game.initialize_grid(grid_size=grid_size, alive_percentage=0.4, seed=int(rng.integers(1 << 30)))
+    game.set_rules(original_rules=False, rules=rules)
+    return game
+
+
+class TestPackedKernels(unittest.TestCase):
+
+    def check_sizes(self, sizes):
+        rng = np.random.default_rng(0)
+        for grid_size in sizes:
+            for births, survivals in random_rule_sets(rng, 4):
+                with self.subTest(grid_size=grid_size, births=births, survivals=survivals):
+                    game = make_game(grid_size, births, survivals, rng)
+                    states = game.states
+                    for _ in range(3):
+                        expected = game.update_binary_states(states)
+                        np.testing.assert_array_equal(game.update_packed_states(states), expected)
+                        states = expected
+
+    def test_step_bits_matches_stencil(self):
+        # Grids of up to 8 cells per side are packed into a single integer
+        self.check_sizes(range(2, 9))
+
+    def test_step_packed_rows_matches_stencil(self):
+        # Larger grids are packed into 64-bit words per row, including
+        # partially filled last words
+        self.check_sizes([9, 63, 64, 65, 128, 129, 191, 192, 193, 256, 320])
+
+
+if __name__ == "__main__":
+    unittest.main()